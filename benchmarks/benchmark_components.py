@@ -0,0 +1,562 @@
+"""Builds every public gfelib component at small, medium and large sizes and records its cost
+
+Every case runs in a fresh interpreter, so cell caches and peak memory never leak between cases.
+
+```sh
+# run all cases, write results as JSON
+$ python benchmarks/benchmark_components.py --output results.json
+
+# run a subset
+$ python benchmarks/benchmark_components.py --output results.json --filter ring circle
+
+# compare two result files, e.g. from two commits
+$ python benchmarks/benchmark_components.py --compare before.json after.json
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import pathlib
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from typing import Any
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+SIZES = ("small", "medium", "large")
+
+METRICS = (
+    "build_time",
+    "peak_memory",
+    "references",
+    "polygons",
+    "vertices",
+    "gds_size",
+)
+
+GEOMETRY_LAYER = (1, 0)
+HANDLE_LAYER = (3, 0)
+LABEL_LAYER = (10, 0)
+
+
+def release_spec() -> Any:
+    import gfelib as gl
+
+    return gl.datatypes.ReleaseSpec(
+        hole_radius=2,
+        distance=5,
+        angle_resolution=10,
+        layer=(2, 0),
+    )
+
+
+def beam_spec() -> Any:
+    import gfelib as gl
+
+    return gl.datatypes.BeamSpec(
+        release_thin=True,
+        release_thick=True,
+        thick_length=(0, 0.5),
+        thick_width=(0, 3),
+        handle_etch_length=(0, 0.5),
+        handle_etch_width=(0, 1),
+        handle_etch_layer=HANDLE_LAYER,
+    )
+
+
+def case_rectangle(scale: int) -> Any:
+    import gfelib as gl
+
+    return gl.basic.rectangle(
+        size=(100 * scale, 100 * scale),
+        geometry_layer=GEOMETRY_LAYER,
+        centered=True,
+        release_spec=release_spec(),
+    )
+
+
+def case_rectangle_ring(scale: int) -> Any:
+    import gfelib as gl
+
+    return gl.basic.rectangle_ring(
+        size=(200 * scale, 200 * scale),
+        width=20 * scale,
+        geometry_layer=GEOMETRY_LAYER,
+        centered=True,
+        release_spec=release_spec(),
+    )
+
+
+def case_circle(scale: int) -> Any:
+    import gfelib as gl
+
+    return gl.basic.circle(
+        radius=50 * scale,
+        geometry_layer=GEOMETRY_LAYER,
+        angle_resolution=0.5,
+        release_spec=release_spec(),
+    )
+
+
+def case_ring(scale: int) -> Any:
+    import gfelib as gl
+
+    return gl.basic.ring(
+        radius_inner=100 * scale,
+        radius_outer=100 * scale + 20 * scale,
+        angles=(0, min(45 * scale, 360)),
+        geometry_layer=GEOMETRY_LAYER,
+        angle_resolution=0.5,
+        release_spec=release_spec(),
+    )
+
+
+def case_circle_max_points(scale: int) -> Any:
+    import gfelib as gl
+
+    return gl.basic.circle(
+        radius=50 * scale,
+        geometry_layer=GEOMETRY_LAYER,
+        angle_resolution=0.05,
+        release_spec=release_spec(),
+        max_points=1000,
+    )
+
+
+def case_circle_max_error(scale: int) -> Any:
+    import gfelib as gl
+
+    return gl.basic.circle(
+        radius=50 * scale,
+        geometry_layer=GEOMETRY_LAYER,
+        angle_resolution=0.5,
+        release_spec=release_spec(),
+        max_error=0.01,
+    )
+
+
+def case_ring_max_points(scale: int) -> Any:
+    import gfelib as gl
+
+    return gl.basic.ring(
+        radius_inner=100 * scale,
+        radius_outer=100 * scale + 20 * scale,
+        angles=(0, 360),
+        geometry_layer=GEOMETRY_LAYER,
+        angle_resolution=0.05,
+        release_spec=release_spec(),
+        max_points=1000,
+    )
+
+
+def case_ring_max_error(scale: int) -> Any:
+    import gfelib as gl
+
+    return gl.basic.ring(
+        radius_inner=100 * scale,
+        radius_outer=100 * scale + 20 * scale,
+        angles=(0, min(45 * scale, 360)),
+        geometry_layer=GEOMETRY_LAYER,
+        angle_resolution=0.5,
+        release_spec=release_spec(),
+        max_error=0.01,
+    )
+
+
+def case_ring_sector(scale: int) -> Any:
+    import gfelib as gl
+
+    return gl.basic.ring_sector(
+        radius_inner=100 * scale,
+        radius_outer=100 * scale + 20 * scale,
+        start=0,
+        step=0.05,
+        count=min(900 * scale, 7200),
+        geometry_layer=GEOMETRY_LAYER,
+    )
+
+
+def case_via(scale: int) -> Any:
+    import gfelib as gl
+
+    return gl.basic.via(
+        radius_first=5 * scale,
+        radius_last=10 * scale,
+        geometry_layers=[(i, 0) for i in range(1, 2 + scale)],
+        angle_resolution=0.5,
+    )
+
+
+def case_beam(scale: int) -> Any:
+    import gfelib as gl
+
+    return gl.flexure.beam(
+        length=100 * scale,
+        width=10,
+        geometry_layer=GEOMETRY_LAYER,
+        beam_spec=beam_spec(),
+        release_spec=release_spec(),
+    )
+
+
+def case_parallel(scale: int) -> Any:
+    import gfelib as gl
+
+    return gl.flexure.parallel(
+        bar_length=100 * scale,
+        bar_width=40,
+        beam_length=300,
+        beam_width=10,
+        beam_pos=[i / (2 * scale) for i in range(2 * scale + 1)],
+        geometry_layer=GEOMETRY_LAYER,
+        beam_spec=beam_spec(),
+        release_spec=release_spec(),
+    )
+
+
+def case_butterfly(scale: int) -> Any:
+    import gfelib as gl
+
+    return gl.flexure.butterfly(
+        radius0=100 * scale,
+        radius1=100 * scale + 50,
+        radius2=100 * scale + 400,
+        width_beam=10,
+        angles=(20, 40),
+        release_inner=True,
+        geometry_layer=GEOMETRY_LAYER,
+        angle_resolution=0.5,
+        beam_spec=beam_spec(),
+        release_spec=release_spec(),
+    )
+
+
+def case_flexure_array(scale: int) -> Any:
+    import gfelib as gl
+
+    return gl.flexure.flexure_array(
+        func=gl.flexure.parallel,
+        params=[
+            dict(
+                bar_length=200,
+                bar_width=40,
+                beam_length=300 + 100 * (i % 2),
+                beam_width=10,
+                beam_pos=[0, 0.5, 1],
+                geometry_layer=GEOMETRY_LAYER,
+                beam_spec=beam_spec(),
+                release_spec=release_spec(),
+            )
+            for i in range(4 * scale)
+            for _ in range(4 * scale)
+        ],
+        origins=[
+            (500 * i, 500 * j) for i in range(4 * scale) for j in range(4 * scale)
+        ],
+        rotations=[180 * (j % 2) for _ in range(4 * scale) for j in range(4 * scale)],
+        mirrors=None,
+    )
+
+
+def case_z_cantilever_half(scale: int) -> Any:
+    import gfelib as gl
+
+    count = 2 * scale
+    beams = [
+        gl.flexure.ZCantileverBeam(
+            length=100,
+            width=10,
+            position=(0, (i + 0.5) / count),
+            inset_x=(0, 0.2 / count),
+            inset_y=(10, 0),
+            isolation_x=(0, 0.5 / count),
+            isolation_y=(40, 0),
+            spec=beam_spec(),
+        )
+        for i in range(count)
+    ]
+    return gl.flexure.z_cantilever_half(
+        length=200 * count,
+        width=200,
+        beams=beams,
+        clearance=5,
+        middle_split=True,
+        geometry_layer=GEOMETRY_LAYER,
+        handle_layer=HANDLE_LAYER,
+        release_spec=release_spec(),
+    )
+
+
+def case_teeth_bank(scale: int) -> Any:
+    import gfelib as gl
+
+    return gl.actuator.teeth_bank(
+        radius=1000,
+        teeth_size=(30, 8),
+        teeth_pitch=1,
+        teeth_count=10 * scale,
+        geometry_layer=GEOMETRY_LAYER,
+    )
+
+
+def case_rotator_gear(scale: int) -> Any:
+    import gfelib as gl
+
+    return gl.actuator.rotator_gear(
+        radius_inner=800,
+        radius_gap=1000,
+        radius_outer=1200,
+        teeth_pitch=0.5,
+        teeth_width=4,
+        teeth_height=20,
+        teeth_clearance=3,
+        teeth_phase=[0, 90, 180, 270],
+        teeth_count=5 * scale,
+        inner_rotor=True,
+        rotor_span=min(20 * scale, 180),
+        geometry_layer=GEOMETRY_LAYER,
+        angle_resolution=0.1,
+        release_spec=release_spec(),
+    )
+
+
+def case_rotator(scale: int) -> Any:
+    import gfelib as gl
+
+    return gl.actuator.rotator(
+        radius_inner=800,
+        radius_gap=1000,
+        radius_outer=1200,
+        teeth_pitch=0.5,
+        teeth_width=4,
+        teeth_height=20,
+        teeth_clearance=3,
+        teeth_phase=[0, 90, 180, 270],
+        teeth_count=5 * scale,
+        inner_rotor=True,
+        rotor_span=min(20 * scale, 90),
+        symmetry=4,
+        mirror=True,
+        geometry_layer=GEOMETRY_LAYER,
+        angle_resolution=0.1,
+        release_spec=release_spec(),
+    )
+
+
+def case_chip_border(scale: int) -> Any:
+    import gfelib as gl
+
+    return gl.device.chip_border(
+        size=(1000 * scale, 1000 * scale),
+        width=50 * scale,
+        geometry_layer=GEOMETRY_LAYER,
+        handle_layer=HANDLE_LAYER,
+        centered=True,
+        release_spec=release_spec(),
+    )
+
+
+def case_sweep_layout(scale: int) -> Any:
+    import gfelib as gl
+
+    return gl.device.sweep_layout(
+        func=gl.basic.rectangle,
+        params=[
+            dict(
+                size=(50 + 10 * i, 50),
+                geometry_layer=GEOMETRY_LAYER,
+                centered=True,
+                release_spec=release_spec(),
+            )
+            for i in range(4 * scale)
+        ],
+        spacing=20,
+        columns=None,
+        label_layer=LABEL_LAYER,
+    )
+
+
+CASES: dict[str, Callable[[int], Any]] = {
+    "rectangle": case_rectangle,
+    "rectangle_ring": case_rectangle_ring,
+    "circle": case_circle,
+    "circle_max_points": case_circle_max_points,
+    "circle_max_error": case_circle_max_error,
+    "ring": case_ring,
+    "ring_max_points": case_ring_max_points,
+    "ring_max_error": case_ring_max_error,
+    "ring_sector": case_ring_sector,
+    "via": case_via,
+    "beam": case_beam,
+    "parallel": case_parallel,
+    "butterfly": case_butterfly,
+    "flexure_array": case_flexure_array,
+    "z_cantilever_half": case_z_cantilever_half,
+    "teeth_bank": case_teeth_bank,
+    "rotator_gear": case_rotator_gear,
+    "rotator": case_rotator,
+    "chip_border": case_chip_border,
+    "sweep_layout": case_sweep_layout,
+}
+
+SCALES = {
+    "small": 1,
+    "medium": 4,
+    "large": 16,
+}
+
+
+def measure(name: str, size: str) -> dict[str, Any]:
+    """Builds one case in this process and returns its metrics"""
+    import gdsfactory as gf
+
+    gf.gpdk.PDK.activate()
+    import gfelib  # noqa: F401, keep the import cost out of the build time
+
+    memory_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    c = CASES[name](SCALES[size])
+    build_time = time.perf_counter() - start
+    memory_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    unit = 1 if sys.platform == "darwin" else 1024
+
+    layout = c.kcl.layout
+    references = sum(
+        layout.cell(ci).child_instances()
+        for ci in c.kdb_cell.called_cells() + [c.cell_index()]
+    )
+
+    polygons = 0
+    vertices = 0
+    for layer_index in layout.layer_indexes():
+        region = gf.kdb.Region(c.kdb_cell.begin_shapes_rec(layer_index))
+        polygons += region.count()
+        vertices += sum(p.num_points() for p in region.each())
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = pathlib.Path(tmpdir) / "benchmark.gds"
+        c.write_gds(gdspath=path)
+        gds_size = path.stat().st_size
+
+    return {
+        "component": name,
+        "size": size,
+        "build_time": build_time,
+        "peak_memory": (memory_after - memory_before) * unit,
+        "references": references,
+        "polygons": polygons,
+        "vertices": vertices,
+        "gds_size": gds_size,
+    }
+
+
+def run(names: list[str], sizes: list[str]) -> dict[str, Any]:
+    """Runs every case in a fresh interpreter and collects the results"""
+    results = []
+    for name in names:
+        for size in sizes:
+            proc = subprocess.run(
+                [sys.executable, __file__, "--case", name, size],
+                capture_output=True,
+                text=True,
+                cwd=ROOT,
+                env={**os.environ, "PYTHONPATH": str(ROOT)},
+            )
+            if proc.returncode != 0:
+                print(f"{name:<20}{size:<8}FAILED", file=sys.stderr)
+                print(proc.stderr, file=sys.stderr)
+                continue
+            result = json.loads(proc.stdout.strip().splitlines()[-1])
+            print(
+                f"{name:<20}{size:<8}"
+                f"{result['build_time']:>10.3f} s"
+                f"{result['references']:>10} refs"
+                f"{result['vertices']:>12} vertices"
+                f"{result['gds_size']:>12} B",
+                file=sys.stderr,
+            )
+            results.append(result)
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "gdsfactory": _package_version("gdsfactory"),
+            "klayout": _package_version("klayout"),
+        },
+        "results": results,
+    }
+
+
+def compare(before: dict[str, Any], after: dict[str, Any]) -> None:
+    """Prints the after / before ratio of every metric for cases present in both runs"""
+    old = {(r["component"], r["size"]): r for r in before["results"]}
+    print(f"{'component':<20}{'size':<8}" + "".join(f"{m:>13}" for m in METRICS))
+    for r in after["results"]:
+        key = (r["component"], r["size"])
+        if key not in old:
+            continue
+        ratios = [r[m] / old[key][m] if old[key][m] else float("nan") for m in METRICS]
+        print(f"{key[0]:<20}{key[1]:<8}" + "".join(f"{x:>13.3f}" for x in ratios))
+
+
+def _git_commit() -> str | None:
+    proc = subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+    )
+    return proc.stdout.strip() if proc.returncode == 0 else None
+
+
+def _package_version(name: str) -> str | None:
+    from importlib import metadata
+
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=pathlib.Path, help="JSON result file")
+    parser.add_argument("--filter", nargs="+", choices=list(CASES), default=None)
+    parser.add_argument("--sizes", nargs="+", choices=SIZES, default=list(SIZES))
+    parser.add_argument("--compare", nargs=2, type=pathlib.Path, default=None)
+    parser.add_argument("--case", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case is not None:
+        print(json.dumps(measure(*args.case)))
+        return
+
+    if args.compare is not None:
+        compare(
+            before=json.loads(args.compare[0].read_text()),
+            after=json.loads(args.compare[1].read_text()),
+        )
+        return
+
+    results = run(args.filter or list(CASES), args.sizes)
+    text = json.dumps(results, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        args.output.write_text(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Measures the cost of importing gfelib and of first access to its submodules
+
+Every case runs in a fresh interpreter and is repeated, the median is reported.
+`--check` fails when `import gfelib` alone, or access to `gl.datatypes`, loads one of the heavy dependencies again.
+
+```sh
+# print timings
+$ python benchmarks/benchmark_import.py
+
+# write results as JSON and guard against regressions, e.g. in CI
+$ python benchmarks/benchmark_import.py --output import.json --check
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import pathlib
+import statistics
+import subprocess
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+# heavy dependencies, `import gfelib` alone must not load them
+HEAVY = ("gdsfactory", "kfactory", "klayout", "numpy", "pydantic")
+
+# heavy dependencies each checked case may load, specs are pydantic models
+ALLOWED: dict[str, tuple[str, ...]] = {
+    "import": (),
+    "datatypes": ("pydantic",),
+}
+
+# statements timed after `import gfelib as gl`
+CASES: dict[str, str] = {
+    "import": "",
+    "datatypes": "gl.datatypes.ReleaseSpec",
+    "utils": "gl.utils.default_cell",
+    "basic": "gl.basic.ring",
+    "all": "gl.datatypes; gl.utils; gl.basic; gl.flexure; gl.actuator; gl.device",
+}
+
+_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import gfelib as gl
+imported = time.perf_counter()
+{statement}
+end = time.perf_counter()
+print(json.dumps({{
+    "import_time": imported - start,
+    "access_time": end - imported,
+    "total_time": end - start,
+    "loaded": sorted(m for m in {heavy!r} if m in sys.modules),
+}}))
+"""
+
+
+def measure(name: str, repeat: int) -> dict[str, object]:
+    """Runs one case `repeat` times, each in a fresh interpreter, and returns the median timings"""
+    runs = []
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                _SCRIPT.format(statement=CASES[name], heavy=HEAVY),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=ROOT,
+            env={**os.environ, "PYTHONPATH": str(ROOT)},
+        )
+        runs.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+    return {
+        "case": name,
+        "statement": CASES[name],
+        "import_time": statistics.median(r["import_time"] for r in runs),
+        "access_time": statistics.median(r["access_time"] for r in runs),
+        "total_time": statistics.median(r["total_time"] for r in runs),
+        "loaded": runs[-1]["loaded"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=pathlib.Path, help="JSON result file")
+    parser.add_argument("--filter", nargs="+", choices=list(CASES), default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit with an error if `import gfelib` or `gl.datatypes` loads a heavy dependency",
+    )
+    args = parser.parse_args()
+
+    results = []
+    for name in args.filter or list(CASES):
+        result = measure(name, args.repeat)
+        print(
+            f"{name:<12}"
+            f"{result['import_time']:>10.4f} s import"
+            f"{result['access_time']:>10.4f} s access"
+            f"{result['total_time']:>10.4f} s total"
+            f"   loaded: {', '.join(result['loaded']) or '-'}",
+            file=sys.stderr,
+        )
+        results.append(result)
+
+    if args.output is not None:
+        args.output.write_text(json.dumps({"results": results}, indent=2) + "\n")
+
+    if args.check:
+        errors = []
+        for name, allowed in ALLOWED.items():
+            loaded = [m for m in measure(name, 1)["loaded"] if m not in allowed]
+            if loaded:
+                errors.append(
+                    f"`{CASES[name] or 'import gfelib'}` loads {', '.join(loaded)}"
+                )
+        if errors:
+            sys.exit("\n".join(errors))
+
+
+if __name__ == "__main__":
+    main()
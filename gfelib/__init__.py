@@ -1,14 +1,38 @@
 # gfelib main module
-# import all submodules here
+# submodules are imported on first attribute access, `import gfelib` alone does not load gdsfactory
 
 from __future__ import annotations
 
-from gfelib import datatypes
-from gfelib import utils
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from gfelib import basic
+if TYPE_CHECKING:
+    from gfelib import datatypes
+    from gfelib import utils
 
-from gfelib import flexure
-from gfelib import actuator
+    from gfelib import basic
 
-from gfelib import device
+    from gfelib import flexure
+    from gfelib import actuator
+
+    from gfelib import device
+
+__all__ = [
+    "datatypes",
+    "utils",
+    "basic",
+    "flexure",
+    "actuator",
+    "device",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # the import system also binds the submodule to this package, so this runs once per submodule
+    return importlib.import_module(f"{__name__}.{name}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,3 +1,5 @@
 from __future__ import annotations
 
 from gfelib.actuator.rotator_gear import rotator_gear
+from gfelib.actuator.rotator import rotator
+from gfelib.actuator.teeth_bank import teeth_bank
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+from collections.abc import Sequence
+
+import gfelib as gl
+
+
+@gl.utils.default_cell
+def rotator(
+    radius_inner: float,
+    radius_gap: float,
+    radius_outer: float,
+    teeth_pitch: float,
+    teeth_width: float,
+    teeth_height: float,
+    teeth_clearance: float,
+    teeth_phase: Sequence[float],
+    teeth_count: int,
+    inner_rotor: bool,
+    rotor_span: float,
+    symmetry: int,
+    mirror: bool,
+    geometry_layer: gf.typings.LayerSpec,
+    angle_resolution: float,
+    release_spec: gl.datatypes.ReleaseSpec | None,
+    max_error: float | None = None,
+) -> gf.Component:
+    """Returns an N-fold symmetric rotator actuator, one `rotator_gear` cell placed every `360 / symmetry` degrees
+
+    Sector `k` exposes the stator ports of its half-rotator as `stator_<k>_<i>`, one per phase `i`
+
+    Args:
+        radius_inner: inner carriage inner radius
+        radius_gap: rotor/stator gap midpoint radius
+        radius_outer: outer carriage outer radius
+        teeth_pitch: electrostatic teeth pitch (unit: degrees)
+        teeth_width: electrostatic teeth width
+        teeth_height: electrostatic teeth height
+        teeth_clearance: teeth clearance between stator and rotor
+        teeth_phase: electrical phase offsets for each bank of teeth (unit: degrees)
+        teeth_count: number of teeth per bank
+        inner_rotor: `True` sets inner carriage as rotor nad outer carriage as stator, vice versa
+        rotor_span: angular width of the rotor carriage of each sector (unit: degrees)
+        symmetry: number of sectors, 2 for a full rotator of two opposite halves
+        mirror: `True` mirrors every odd sector about its axis, reversing its phase order
+        geometry_layer: actuator polygon layer
+        angle_resolution: degrees per point for circular geometries
+        release_spec: release specifications, `None` for no release
+        max_error: maximum chord error of circular geometries, overrides `angle_resolution` per radius, `None` to use `angle_resolution`
+    """
+    if symmetry < 1:
+        raise ValueError("Rotator must have symmetry >= 1")
+    sector_span = 360 / symmetry
+    if rotor_span > sector_span:
+        raise ValueError("Rotor carriage must have span <= 360 / symmetry")
+    if len(teeth_phase) * teeth_count * teeth_pitch > sector_span:
+        raise ValueError("Stator banks must have span <= 360 / symmetry")
+
+    c = gf.Component()
+
+    # built once, every sector is a reference
+    half = gl.actuator.rotator_gear(
+        radius_inner=radius_inner,
+        radius_gap=radius_gap,
+        radius_outer=radius_outer,
+        teeth_pitch=teeth_pitch,
+        teeth_width=teeth_width,
+        teeth_height=teeth_height,
+        teeth_clearance=teeth_clearance,
+        teeth_phase=teeth_phase,
+        teeth_count=teeth_count,
+        inner_rotor=inner_rotor,
+        rotor_span=rotor_span,
+        geometry_layer=geometry_layer,
+        angle_resolution=angle_resolution,
+        release_spec=release_spec,
+        max_error=max_error,
+    )
+
+    for k in range(symmetry):
+        ref = c << half
+        ref.dcplx_trans = gf.kdb.DCplxTrans(
+            1,
+            k * sector_span,
+            mirror and k % 2 == 1,
+            0,
+            0,
+        )
+        for port in ref.ports:
+            c.add_port(
+                name=port.name.replace("stator_", f"stator_{k}_"),
+                port=port,
+            )
+
+    return c
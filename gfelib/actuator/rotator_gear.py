@@ -24,10 +24,11 @@ def rotator_gear(
     geometry_layer: gf.typings.LayerSpec,
     angle_resolution: float,
     release_spec: gl.datatypes.ReleaseSpec | None,
+    max_error: float | None = None,
 ) -> gf.Component:
-    """Returns a half-rotator actuator
+    """Returns a half-rotator actuator, with an electrical port `stator_<i>` on the free edge of the stator ring of each phase
 
-    **Warning**: release holes are never added to the electrostatic teeth, regardless of dimensions
+    **Warning**: release holes are never added to the electrostatic teeth, regardless of dimensions, see `gl.utils.unreleased_islands`
 
     Args:
         radius_inner: inner carriage inner radius
@@ -44,6 +45,7 @@ def rotator_gear(
         geometry_layer: actuator polygon layer
         angle_resolution: degrees per point for circular geometries
         release_spec: release specifications, `None` for no release
+        max_error: maximum chord error of circular geometries, overrides `angle_resolution` per radius, `None` to use `angle_resolution`
     """
     c = gf.Component()
 
@@ -51,8 +53,15 @@ def rotator_gear(
     radius_teeth_outer = radius_gap + (0.5 * teeth_clearance + teeth_height)
     teeth_width_angle = teeth_width / radius_gap / (np.pi / 180)
 
+    # the ring ending at `radius_teeth_inner` has the coarsest adaptive resolution
     teeth_ring_overlap = gl.utils.sagitta_offset_safe(
-        radius_teeth_inner, teeth_width, angle_resolution
+        radius_teeth_inner,
+        teeth_width,
+        (
+            angle_resolution
+            if max_error is None
+            else gl.utils.angle_resolution_safe(radius_teeth_inner, max_error)
+        ),
     )
 
     stator_teeth_angles = []
@@ -78,54 +87,100 @@ def rotator_gear(
         rotor_radius_o, stator_radius_o = (stator_radius_o, rotor_radius_o)
         rotor_teeth_x, stator_teeth_x = stator_teeth_x, rotor_teeth_x
 
-    teeth = gf.components.rectangle(
-        size=(teeth_height + teeth_ring_overlap, teeth_width),
-        layer=geometry_layer,
-        centered=True,
+    # rotor ring and one stator ring per phase, independent of each other
+    rotor_ring, *stator_rings = gl.utils.build_cells(
+        func=gl.basic.ring,
+        params=[
+            dict(
+                radius_inner=rotor_radius_i,
+                radius_outer=rotor_radius_o,
+                angles=(-0.5 * rotor_span, 0.5 * rotor_span),
+                geometry_layer=geometry_layer,
+                angle_resolution=angle_resolution,
+                release_spec=release_spec,
+                max_error=max_error,
+            )
+        ]
+        + [
+            dict(
+                radius_inner=stator_radius_i,
+                radius_outer=stator_radius_o,
+                angles=(
+                    phase[0] - 0.5 * teeth_width_angle,
+                    phase[-1] + 0.5 * teeth_width_angle,
+                ),
+                geometry_layer=geometry_layer,
+                angle_resolution=angle_resolution,
+                release_spec=None,
+                max_error=max_error,
+            )
+            for phase in stator_teeth_angles
+        ],
     )
 
     # rotor ring
-    _ = c << gl.basic.ring(
-        radius_inner=rotor_radius_i,
-        radius_outer=rotor_radius_o,
-        angles=(-0.5 * rotor_span, 0.5 * rotor_span),
+    _ = c << rotor_ring
+
+    # rotor teeth, mirrored banks on both sides of the x-axis
+    rotor_teeth_count = len(
+        np.arange(
+            0.5 * teeth_pitch,
+            0.5 * (rotor_span - teeth_pitch),
+            teeth_pitch,
+        )
+    )
+    if rotor_teeth_count > 0:
+        rotor_bank = gl.actuator.teeth_bank(
+            radius=rotor_teeth_x,
+            teeth_size=(teeth_height + teeth_ring_overlap, teeth_width),
+            teeth_pitch=teeth_pitch,
+            teeth_count=rotor_teeth_count,
+            geometry_layer=geometry_layer,
+        )
+        for angle in [
+            0.5 * teeth_pitch,
+            -0.5 * teeth_pitch - (rotor_teeth_count - 1) * teeth_pitch,
+        ]:
+            ref = c << rotor_bank
+            ref.rotate(angle, (0, 0))
+
+    stator_bank = gl.actuator.teeth_bank(
+        radius=stator_teeth_x,
+        teeth_size=(teeth_height + teeth_ring_overlap, teeth_width),
+        teeth_pitch=teeth_pitch,
+        teeth_count=teeth_count,
         geometry_layer=geometry_layer,
-        angle_resolution=angle_resolution,
-        release_spec=release_spec,
     )
 
-    # rotor teeth
-    for angle in np.arange(
-        0.5 * teeth_pitch,
-        0.5 * (rotor_span - teeth_pitch),
-        teeth_pitch,
-    ):
-        ref_pos = c << teeth
-        ref_pos.movex(rotor_teeth_x)
-        ref_pos.rotate(angle, (0, 0))
-        ref_neg = c << teeth
-        ref_neg.movex(rotor_teeth_x)
-        ref_neg.rotate(-angle, (0, 0))
-
-    for phase in stator_teeth_angles:
+    # stator ports face away from the gap, width snapped to an even number of database units
+    stator_port_radius = stator_radius_o if inner_rotor else stator_radius_i
+    stator_port_width = (
+        np.floor(0.5 * (stator_radius_o - stator_radius_i) / c.kcl.dbu + 0.5)
+        * 2
+        * c.kcl.dbu
+    )
+
+    for i, (phase, stator_ring) in enumerate(zip(stator_teeth_angles, stator_rings)):
         # stator ring
-        ring_ref = c << gl.basic.ring(
-            radius_inner=stator_radius_i,
-            radius_outer=stator_radius_o,
-            angles=(
-                phase[0] - 0.5 * teeth_width_angle,
-                phase[-1] + 0.5 * teeth_width_angle,
-            ),
-            geometry_layer=geometry_layer,
-            angle_resolution=angle_resolution,
-            release_spec=None,
-        )
+        ring_ref = c << stator_ring
         ring_ref.rotate(stator_offset, (0, 0))
 
         # stator teeth
-        for angle in phase:
-            ref = c << teeth
-            ref.movex(stator_teeth_x)
-            ref.rotate(angle + stator_offset, (0, 0))
+        bank_ref = c << stator_bank
+        bank_ref.rotate(phase[0] + stator_offset, (0, 0))
+
+        # stator port, centered on the phase
+        angle = 0.5 * (phase[0] + phase[-1]) + stator_offset
+        c.add_port(
+            name=f"stator_{i}",
+            center=(
+                stator_port_radius * np.cos(angle * np.pi / 180),
+                stator_port_radius * np.sin(angle * np.pi / 180),
+            ),
+            width=stator_port_width,
+            orientation=angle if inner_rotor else angle + 180,
+            layer=geometry_layer,
+            port_type="electrical",
+        )
 
     return c
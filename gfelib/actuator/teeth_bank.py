@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import gfelib as gl
+
+
+@gl.utils.default_cell
+def teeth_bank(
+    radius: float,
+    teeth_size: gf.typings.Size,
+    teeth_pitch: float,
+    teeth_count: int,
+    geometry_layer: gf.typings.LayerSpec,
+) -> gf.Component:
+    """Returns a bank of identical radial teeth, the first tooth is centered on the positive x-axis and the rest follow counter-clockwise
+
+    A bank is made of two smaller banks, the first `2^k` teeth and the remaining teeth rotated by `2^k` pitches,
+    so `n` teeth take about `2 * log2(n)` cells of two references each, and smaller banks are shared with every bank that contains them.
+    Banks are only rotated about (0, 0), never moved, so every tooth is an exact rotation of the first one and no displacement is snapped.
+
+    Args:
+        radius: teeth center radius
+        teeth_size: teeth radial length and tangential width
+        teeth_pitch: teeth pitch (unit: degrees)
+        teeth_count: number of teeth
+        geometry_layer: teeth polygon layer
+    """
+    c = gf.Component()
+
+    if teeth_count == 1:
+        tooth_ref = c << gf.components.rectangle(
+            size=teeth_size,
+            layer=geometry_layer,
+            centered=True,
+        )
+        tooth_ref.movex(radius)
+        return c
+
+    if teeth_count < 1:
+        return c
+
+    # split off the largest power of two, so the first sub-bank is shared by every bank of up to twice its size
+    half = 1 << ((teeth_count - 1).bit_length() - 1)
+    for start, count in [(0, half), (half, teeth_count - half)]:
+        bank_ref = c << gl.actuator.teeth_bank(
+            radius=radius,
+            teeth_size=teeth_size,
+            teeth_pitch=teeth_pitch,
+            teeth_count=count,
+            geometry_layer=geometry_layer,
+        )
+        bank_ref.rotate(start * teeth_pitch, (0, 0))
+
+    return c
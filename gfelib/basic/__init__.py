@@ -4,4 +4,5 @@ from gfelib.basic.circle import circle
 from gfelib.basic.rectangle_ring import rectangle_ring
 from gfelib.basic.rectangle import rectangle
 from gfelib.basic.ring import ring
+from gfelib.basic.ring_sector import ring_sector
 from gfelib.basic.via import via
@@ -13,6 +13,8 @@ def circle(
     geometry_layer: gf.typings.LayerSpec,
     angle_resolution: float,
     release_spec: gl.datatypes.ReleaseSpec | None,
+    max_error: float | None = None,
+    max_points: int | None = None,
 ) -> gf.Component:
     """Returns a circle with release holes
 
@@ -21,34 +23,45 @@ def circle(
         geometry_layer: circle polygon layer
         angle_resolution: degrees per point for circular geometries
         release_spec: release specifications, `None` for no release
+        max_error: maximum chord error of circular geometries, overrides `angle_resolution` per radius, `None` to use `angle_resolution`
+        max_points: maximum number of vertices per polygon, splits the circle into `ring_sector` wedges with the same vertices, `None` for a single polygon
     """
     c = gf.Component()
 
-    _ = c << gf.components.circle(
-        radius=radius,
-        layer=geometry_layer,
-        angle_resolution=angle_resolution,
-    )
+    if max_error is not None:
+        angle_resolution = gl.utils.angle_resolution_safe(radius, max_error)
 
-    if release_spec is None:
-        return c
+    if max_points is None:
+        _ = c << gf.components.circle(
+            radius=radius,
+            layer=geometry_layer,
+            angle_resolution=angle_resolution,
+        )
+    else:
+        # same discretization as `gf.components.circle`
+        steps = int(np.round(360 / angle_resolution))
+        for start, count, rotation in gl.utils.fracture_sectors(
+            steps=steps,
+            step=360 / steps,
+            max_points=max_points,
+            wedge=True,
+        ):
+            sector_ref = c << gl.basic.ring_sector(
+                radius_inner=0,
+                radius_outer=radius,
+                start=start,
+                step=360 / steps,
+                count=count,
+                geometry_layer=geometry_layer,
+            )
+            sector_ref.rotate(rotation, (0, 0))
 
-    if not release_spec.released:
-        return c
-
-    if radius <= release_spec.distance:
+    if release_spec is None:
         return c
 
-    s = 2 * (release_spec.hole_radius + release_spec.distance) / np.sqrt(2)
-    sr = radius / (radius // s + 1.5)
-
-    for r in np.arange(0, radius, sr):
-        steps = 2 * np.pi * r // s + 1
-        dt = 2 * np.pi / steps
-        t = np.arange(0.5 * dt, 2 * np.pi + dt, dt)
-        points = np.stack((r * np.cos(t), r * np.sin(t)), axis=-1)
-        for point in points[:-1]:
-            ref = c << release_spec.hole
-            ref.move(point)
+    gl.utils.circle_holes(
+        radius=radius,
+        release_spec=release_spec,
+    ).place(c)
 
     return c
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 import gdsfactory as gf
 
-import numpy as np
-
 import gfelib as gl
 
 
@@ -39,18 +37,30 @@ def rectangle(
     if size[0] <= release_spec.distance or size[1] <= release_spec.distance:
         return c
 
-    s = 2 * (release_spec.hole_radius + release_spec.distance) / np.sqrt(2)
-    sx = size[0] / np.ceil(size[0] / s)
-    sy = size[1] / np.ceil(size[1] / s)
-
-    for y in np.arange(0.5 * sy, size[1], sy):
-        for x in np.arange(0.5 * sx, size[0], sx):
-            ref = c << release_spec.hole
-            ref.move(
-                (
-                    x - (0.5 * size[0] if centered else 0),
-                    y - (0.5 * size[1] if centered else 0),
-                )
-            )
+    if release_spec.hole_array:
+        gl.utils.place_hole_array(
+            component=c,
+            hole=release_spec.hole,
+            size=size,
+            pitch=gl.utils.release_pitch(release_spec),
+            centered=centered,
+        )
+        return c
+
+    if release_spec.hole_tiling:
+        gl.utils.place_hole_tiles(
+            component=c,
+            hole=release_spec.hole,
+            size=size,
+            pitch=gl.utils.release_pitch(release_spec),
+            centered=centered,
+        )
+        return c
+
+    gl.utils.rectangle_holes(
+        size=size,
+        centered=centered,
+        release_spec=release_spec,
+    ).place(c)
 
     return c
@@ -26,26 +26,21 @@ def rectangle_ring(
     """
     c = gf.Component()
 
-    release = True
-
-    if release_spec is None:
-        release = False
-
-    elif not release_spec.released:
-        release = False
-
-    elif size[0] <= release_spec.distance or size[1] <= release_spec.distance:
-        release = False
-
-    elif width <= release_spec.distance:
-        release = False
-
-    corner = gl.basic.rectangle(
-        size=(width, width),
+    # the parts are built without holes, their holes are merged into the ring
+    rectangle = dict(
         geometry_layer=geometry_layer,
         centered=False,
-        release_spec=release_spec if release else None,
+        release_spec=None,
+    )
+    corner, bar_x, bar_y = gl.utils.build_cells(
+        func=gl.basic.rectangle,
+        params=[
+            dict(size=(width, width), **rectangle),
+            dict(size=(size[0] - 2 * width, width), **rectangle),
+            dict(size=(width, size[1] - 2 * width), **rectangle),
+        ],
     )
+
     for y in [0, size[1] - width]:
         for x in [0, size[0] - width]:
             ref = c << corner
@@ -56,12 +51,6 @@ def rectangle_ring(
                 )
             )
 
-    bar_x = gl.basic.rectangle(
-        size=(size[0] - 2 * width, width),
-        geometry_layer=geometry_layer,
-        centered=False,
-        release_spec=release_spec if release else None,
-    )
     for y in [0, size[1] - width]:
         ref = c << bar_x
         ref.move(
@@ -71,12 +60,6 @@ def rectangle_ring(
             )
         )
 
-    bar_y = gl.basic.rectangle(
-        size=(width, size[1] - 2 * width),
-        geometry_layer=geometry_layer,
-        centered=False,
-        release_spec=release_spec if release else None,
-    )
     for x in [0, size[0] - width]:
         ref = c << bar_y
         ref.move(
@@ -86,4 +69,14 @@ def rectangle_ring(
             )
         )
 
+    if release_spec is None:
+        return c
+
+    gl.utils.rectangle_ring_holes(
+        size=size,
+        width=width,
+        centered=centered,
+        release_spec=release_spec,
+    ).place(c)
+
     return c
@@ -15,8 +15,10 @@ def ring(
     geometry_layer: gf.typings.LayerSpec,
     angle_resolution: float,
     release_spec: gl.datatypes.ReleaseSpec | None,
+    max_error: float | None = None,
+    max_points: int | None = None,
 ) -> gf.Component:
-    """Returns a ring with release holes
+    """Returns a ring with release holes, a rotated reference to the ring starting at 0 degrees if `angles[0]` is not `0`
 
     Args:
         radius_inner: ring inner radius
@@ -25,6 +27,8 @@ def ring(
         geometry_layer: ring polygon layer
         angle_resolution: degrees per point for circular geometries
         release_spec: release specifications, `None` for no release
+        max_error: maximum chord error of circular geometries, overrides `angle_resolution` per radius, `None` to use `angle_resolution`
+        max_points: maximum number of vertices per polygon, splits the ring into `ring_sector` cells with the same vertices, `None` for a single polygon
     """
     c = gf.Component()
 
@@ -32,41 +36,60 @@ def ring(
     span += 360 if span < 0 else 0
     span = 360 if span > 360 else span
 
-    width = radius_outer - radius_inner
-
-    ring_ref = c << gf.components.ring(
-        radius=0.5 * (radius_inner + radius_outer),
-        width=radius_outer - radius_inner,
-        angle=span,
-        layer=geometry_layer,
-        angle_resolution=angle_resolution,
-    )
-    ring_ref.rotate(angles[0], (0, 0))
-
-    if release_spec is None:
+    if angles[0] != 0:
+        # built from the span alone, holes included, the start angle is a reference rotation,
+        # so equal arcs at different orientations share one cell
+        ring_ref = c << gl.basic.ring(
+            radius_inner=radius_inner,
+            radius_outer=radius_outer,
+            angles=(0, round(span, 9)),
+            geometry_layer=geometry_layer,
+            angle_resolution=angle_resolution,
+            release_spec=release_spec,
+            max_error=max_error,
+            max_points=max_points,
+        )
+        ring_ref.rotate(angles[0], (0, 0))
         return c
 
-    if not release_spec.released:
-        return c
+    if max_error is not None:
+        angle_resolution = gl.utils.angle_resolution_safe(radius_outer, max_error)
 
-    if (
-        radius_outer <= release_spec.distance
-        or width <= release_spec.distance
-        or span * np.pi / 180 * radius_outer <= release_spec.distance
-    ):
-        return c
+    if max_points is None:
+        _ = c << gf.components.ring(
+            radius=0.5 * (radius_inner + radius_outer),
+            width=radius_outer - radius_inner,
+            angle=span,
+            layer=geometry_layer,
+            angle_resolution=angle_resolution,
+        )
+    else:
+        # same discretization as `gf.components.ring`, which spreads `360 / angle_resolution` segments over the span
+        steps = int(np.round(360 / angle_resolution))
+        for start, count, rotation in gl.utils.fracture_sectors(
+            steps=steps,
+            step=span / steps,
+            max_points=max_points,
+            wedge=False,
+        ):
+            sector_ref = c << gl.basic.ring_sector(
+                radius_inner=radius_inner,
+                radius_outer=radius_outer,
+                start=start,
+                step=span / steps,
+                count=count,
+                geometry_layer=geometry_layer,
+            )
+            sector_ref.rotate(rotation, (0, 0))
 
-    s = 2 * (release_spec.hole_radius + release_spec.distance) / np.sqrt(2)
-    sr = width / (width // s + 1)
+    if release_spec is None:
+        return c
 
-    for r in np.arange(radius_inner + 0.5 * sr, radius_outer, sr):
-        steps = span * np.pi / 180 * r // s + 1
-        dt = span / 180 * np.pi / steps
-        t = np.arange(0.5 * dt, span / 180 * np.pi + dt, dt)
-        points = np.stack((r * np.cos(t), r * np.sin(t)), axis=-1)
-        for point in points[:-1]:
-            ref = c << release_spec.hole
-            ref.move(point)
-            ref.rotate(angles[0], (0, 0))
+    gl.utils.ring_holes(
+        radius_inner=radius_inner,
+        radius_outer=radius_outer,
+        span=span,
+        release_spec=release_spec,
+    ).place(c)
 
     return c
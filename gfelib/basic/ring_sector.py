@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import numpy as np
+
+import gfelib as gl
+
+
+@gl.utils.default_cell
+def ring_sector(
+    radius_inner: float,
+    radius_outer: float,
+    start: float,
+    step: float,
+    count: int,
+    geometry_layer: gf.typings.LayerSpec,
+) -> gf.Component:
+    """Returns one annular sector polygon with arc vertices at `start + i * step` for `i` from `0` to `count`, a wedge if `radius_inner` is `0`
+
+    Args:
+        radius_inner: sector inner radius
+        radius_outer: sector outer radius
+        start: sector start angle (unit: degrees)
+        step: angle between arc vertices (unit: degrees)
+        count: number of arc segments
+        geometry_layer: sector polygon layer
+    """
+    c = gf.Component()
+
+    # same vertex order as `gf.components.ring`, inner arc counter-clockwise then outer arc clockwise
+    t = (start + step * np.arange(count + 1)) * np.pi / 180
+    inner = (
+        radius_inner * np.stack((np.cos(t), np.sin(t)), axis=-1)
+        if radius_inner > 0
+        else np.zeros((1, 2))
+    )
+    outer = radius_outer * np.stack((np.cos(t), np.sin(t)), axis=-1)
+    c.add_polygon(
+        points=np.concatenate((inner, outer[::-1])),
+        layer=geometry_layer,
+    )
+
+    return c
@@ -14,6 +14,7 @@ def via(
     radius_last: float,
     geometry_layers: Sequence[gf.typings.LayerSpec],
     angle_resolution: float,
+    max_error: float | None = None,
 ) -> gf.Component:
     """Returns a via on multiple layers with linearly spaced radii
 
@@ -22,6 +23,7 @@ def via(
         radius_last: via radius on last layer (`geometry_layers[-1]`)
         geometry_layers: via polygon layers, if only one layer is specified, `radius_last` is ignored
         angle_resolution: degrees per point for circular geometries
+        max_error: maximum chord error of circular geometries, overrides `angle_resolution` per radius, `None` to use `angle_resolution`
     """
     c = gf.Component()
 
@@ -31,9 +33,14 @@ def via(
         else 0
     )
     for i, layer in enumerate(geometry_layers):
+        radius = radius_first + i * step
         _ = c << gf.components.circle(
-            radius=radius_first + i * step,
-            angle_resolution=angle_resolution,
+            radius=radius,
+            angle_resolution=(
+                angle_resolution
+                if max_error is None
+                else gl.utils.angle_resolution_safe(radius, max_error)
+            ),
             layer=layer,
         )
 
@@ -1,4 +1,5 @@
 from __future__ import annotations
 
+from gfelib.datatypes.frozen_spec import FrozenSpec
 from gfelib.datatypes.beam_spec import BeamSpec
 from gfelib.datatypes.release_spec import ReleaseSpec
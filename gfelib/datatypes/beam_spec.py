@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import gdsfactory as gf
-
 import pydantic
-import hashlib
+
+from gfelib.datatypes.frozen_spec import FrozenSpec
+from gfelib.datatypes.layer_spec import LayerSpec
 
 
-class BeamSpec(pydantic.BaseModel):
+class BeamSpec(FrozenSpec):
     """Additional specifications for complex beams
     - thicker mid-section of the beam
 
@@ -34,7 +34,7 @@ class BeamSpec(pydantic.BaseModel):
     handle_etch_length: tuple[float, float] = (0, 0)
     handle_etch_width: tuple[float, float] = (0, 0)
     handle_etch_offset: tuple[float, float] = (0, 0)
-    handle_etch_layer: gf.typings.LayerSpec | None = None
+    handle_etch_layer: LayerSpec | None = None
 
     @property
     def thickened(self) -> bool:
@@ -83,7 +83,3 @@ class BeamSpec(pydantic.BaseModel):
 
     def get_handle_etch_offset(self, beam_length: float) -> float:
         return self.handle_etch_offset[0] + self.handle_etch_offset[1] * beam_length
-
-    @property
-    def hash(self) -> str:
-        return hashlib.md5(str(self).encode()).hexdigest()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import pydantic
+import functools
+import hashlib
+import json
+import weakref
+from typing import Any, ClassVar, Self
+
+# one shared instance per fingerprint, see `FrozenSpec.interned`
+_INTERNED: weakref.WeakValueDictionary[str, FrozenSpec] = weakref.WeakValueDictionary()
+
+# values computed once per instance, dropped by `model_copy`
+_CACHED = ("fingerprint", "_str", "_hash")
+
+
+class FrozenSpec(pydantic.BaseModel):
+    """Base class of immutable specifications, e.g. `BeamSpec` and `ReleaseSpec`
+
+    The canonical fingerprint, the hash and the string form are computed once per instance.
+    Equal specs compare by fingerprint, `interned` returns a single shared instance for all of them.
+    """
+
+    model_config = pydantic.ConfigDict(extra="forbid", frozen=True)
+
+    # fields added after cells were first named from the spec, left out of the string form at their default so those names are kept
+    _unnamed_defaults: ClassVar[tuple[str, ...]] = ()
+
+    @functools.cached_property
+    def fingerprint(self) -> str:
+        """SHA-256 of the class name and the fields as canonical JSON"""
+        content = json.dumps(
+            [type(self).__qualname__, self.model_dump(mode="json")],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    @property
+    def hash(self) -> str:
+        return self.fingerprint
+
+    def interned(self) -> Self:
+        """Returns the shared instance equal to this spec, registering this one if there is none"""
+        return _INTERNED.setdefault(self.fingerprint, self)
+
+    def model_copy(
+        self,
+        *,
+        update: dict[str, Any] | None = None,
+        deep: bool = False,
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        for name in _CACHED:
+            copied.__dict__.pop(name, None)
+        return copied
+
+    @functools.cached_property
+    def _str(self) -> str:
+        fields = type(self).model_fields
+        return " ".join(
+            repr(value) if name is None else f"{name}={value!r}"
+            for name, value in self.__repr_args__()
+            if name not in self._unnamed_defaults or value != fields[name].default
+        )
+
+    @functools.cached_property
+    def _hash(self) -> int:
+        return hash(self.fingerprint)
+
+    def __str__(self) -> str:
+        # cell names serialize specs with `str`
+        return self._str
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.fingerprint == other.fingerprint
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+import enum
+from typing import TypeAlias
+
+# accepts the same layers as `gf.typings.LayerSpec` without importing gdsfactory, layer enums of a PDK are `enum.Enum` members
+LayerSpec: TypeAlias = tuple[int, int] | str | int | enum.Enum
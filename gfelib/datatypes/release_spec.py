@@ -1,12 +1,20 @@
 from __future__ import annotations
 
-import gdsfactory as gf
-
 import pydantic
-import hashlib
+from typing import TYPE_CHECKING
+
+import gfelib as gl
+from gfelib.datatypes.frozen_spec import FrozenSpec
+from gfelib.datatypes.layer_spec import LayerSpec
+
+if TYPE_CHECKING:
+    import gdsfactory as gf
+
+# hole cells shared by every equal spec for the whole session, see `ReleaseSpec.clear_hole_cache`
+_HOLE_CACHE: dict[ReleaseSpec, tuple[gf.Component, gf.kdb.DPolygon]] = {}
 
 
-class ReleaseSpec(pydantic.BaseModel):
+class ReleaseSpec(FrozenSpec):
     """Isotropic release specifications
 
     Parameters:
@@ -14,14 +22,22 @@ class ReleaseSpec(pydantic.BaseModel):
         distance: isotropic release distance
         angle_resolution: degrees per point for circular geometries
         layer: release hole layer
+        max_error: maximum chord error of the release hole, overrides `angle_resolution`, `None` to use `angle_resolution`
+        hole_array: `True` to place the hole lattice of a `rectangle` as array references, holes keep their exact positions
+        hole_tiling: `True` to place the hole lattice of a `rectangle` as a hierarchy of shared tiles, holes keep their exact positions, ignored if `hole_array`, composites such as `rectangle_ring` merge the holes of their parts into array references instead
     """
 
     model_config = pydantic.ConfigDict(extra="forbid", frozen=True)
 
+    _unnamed_defaults = ("max_error", "hole_array", "hole_tiling")
+
     hole_radius: float
     distance: float
     angle_resolution: float
-    layer: gf.typings.LayerSpec
+    layer: LayerSpec
+    max_error: float | None = None
+    hole_array: bool = False
+    hole_tiling: bool = False
 
     @property
     def released(self) -> bool:
@@ -31,14 +47,39 @@ class ReleaseSpec(pydantic.BaseModel):
             return False
         return True
 
-    @property
-    def hole(self) -> gf.Component:
-        return gf.components.circle(
+    def _hole_cached(self) -> tuple[gf.Component, gf.kdb.DPolygon]:
+        cached = _HOLE_CACHE.get(self)
+        if cached is not None and not cached[0].destroyed():
+            return cached
+
+        # deferred, specs alone do not load gdsfactory
+        import gdsfactory as gf
+
+        hole = gf.components.circle(
             radius=self.hole_radius,
-            angle_resolution=self.angle_resolution,
+            angle_resolution=(
+                self.angle_resolution
+                if self.max_error is None
+                else gl.utils.angle_resolution_safe(self.hole_radius, self.max_error)
+            ),
             layer=self.layer,
         )
+        region = gf.kdb.Region(hole.kdb_cell.begin_shapes_rec(gf.get_layer(self.layer)))
+        polygon = next(iter(region.merged().each())).to_dtype(hole.kcl.dbu)
+        _HOLE_CACHE[self] = (hole, polygon)
+        return hole, polygon
+
+    @property
+    def hole(self) -> gf.Component:
+        """Release hole cell, built once per spec and reused until `clear_hole_cache`"""
+        return self._hole_cached()[0]
 
     @property
-    def hash(self) -> str:
-        return hashlib.md5(str(self).encode()).hexdigest()
+    def hole_polygon(self) -> gf.kdb.DPolygon:
+        """Release hole polygon centered at (0, 0), in um"""
+        return self._hole_cached()[1]
+
+    @staticmethod
+    def clear_hole_cache() -> None:
+        """Forgets all memoized hole cells, call after activating a different PDK"""
+        _HOLE_CACHE.clear()
@@ -1,3 +1,4 @@
 from __future__ import annotations
 
 from gfelib.device.chip_border import chip_border
+from gfelib.device.sweep_layout import sweep_layout
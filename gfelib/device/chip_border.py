@@ -27,13 +27,21 @@ def chip_border(
     """
     c = gf.Component()
 
+    # the ring is built without holes, its holes are placed in the border directly
     _ = c << gl.basic.rectangle_ring(
         size=size,
         width=width,
         geometry_layer=geometry_layer,
         centered=centered,
-        release_spec=release_spec,
+        release_spec=None,
     )
+    if release_spec is not None:
+        gl.utils.rectangle_ring_holes(
+            size=size,
+            width=width,
+            centered=centered,
+            release_spec=release_spec,
+        ).place(c)
 
     if handle_layer is None:
         return c
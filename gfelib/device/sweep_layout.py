@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import numpy as np
+import pydantic
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import gfelib as gl
+
+
+@gl.utils.default_cell
+def sweep_layout(
+    func: Callable[..., gf.Component],
+    params: Sequence[dict[str, Any]],
+    spacing: float,
+    columns: int | None,
+    label_layer: gf.typings.LayerSpec | None,
+) -> gf.Component:
+    """Returns cell variants tiled row by row from the north-west, center of the first tile is (0, 0)
+
+    Args:
+        func: cell function
+        params: list of parameter dicts, one variant each
+        spacing: clearance between neighbouring variants
+        columns: number of tile columns, `None` for a square layout
+        label_layer: variant label layer, `None` for no labels
+    """
+    c = gf.Component()
+
+    cells = [func(**p) for p in params]
+    if len(cells) == 0:
+        return c
+
+    columns = int(np.ceil(np.sqrt(len(cells)))) if columns is None else columns
+    pitch_x = max(cell.dbbox().width() for cell in cells) + spacing
+    pitch_y = max(cell.dbbox().height() for cell in cells) + spacing
+
+    # only label the parameters that actually change across the sweep
+    keys = sorted({k for p in params for k in p})
+    keys = [k for k in keys if len({repr(p.get(k)) for p in params}) > 1]
+
+    for i, (cell, p) in enumerate(zip(cells, params)):
+        row, column = divmod(i, columns)
+        x = column * pitch_x
+        y = -row * pitch_y
+
+        center = cell.dbbox().center()
+        ref = c << cell
+        ref.move((x - center.x, y - center.y))
+
+        if label_layer is not None:
+            c.add_label(
+                text=", ".join(f"{k}={_label_value(p.get(k))}" for k in keys),
+                position=(x - 0.5 * pitch_x + 0.5 * spacing, y + 0.5 * pitch_y),
+                layer=label_layer,
+            )
+
+    return c
+
+
+def _label_value(value: Any) -> str:
+    if isinstance(value, pydantic.BaseModel) and hasattr(value, "hash"):
+        return f"{type(value).__name__}:{value.hash[:8]}"
+    if isinstance(value, float):
+        return f"{value:g}"
+    return str(value)
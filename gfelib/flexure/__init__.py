@@ -2,5 +2,6 @@ from __future__ import annotations
 
 from gfelib.flexure.beam import beam
 from gfelib.flexure.butterfly import butterfly
+from gfelib.flexure.flexure_array import flexure_array
 from gfelib.flexure.parallel import parallel
 from gfelib.flexure.z_cantilever import ZCantileverBeam, z_cantilever_half
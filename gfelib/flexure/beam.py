@@ -15,7 +15,7 @@ def beam(
 ) -> gf.Component:
     """Returns a complex beam, centered at (0, 0)
 
-    **Warning**: if beam_spec is not specified, release holes are never added to the beam, regardless of dimensions
+    **Warning**: if beam_spec is not specified, release holes are never added to the beam, regardless of dimensions, see `gl.utils.unreleased_islands`
 
     Args:
         length: beam length (x)
@@ -47,12 +47,21 @@ def beam(
         )
         handle_rect.movex(beam_spec.get_handle_etch_offset(length))
 
+    # the parts are built without holes, their holes are merged into the beam
+    if release_spec is not None:
+        gl.utils.beam_holes(
+            length=length,
+            width=width,
+            beam_spec=beam_spec,
+            release_spec=release_spec,
+        ).place(c)
+
     if not beam_spec.thickened:
         _ = c << gl.basic.rectangle(
             size=(length, width),
             geometry_layer=geometry_layer,
             centered=True,
-            release_spec=release_spec if beam_spec.release_thin else None,
+            release_spec=None,
         )
         return c
 
@@ -67,7 +76,7 @@ def beam(
         size=(thick_length, thick_width),
         geometry_layer=geometry_layer,
         centered=True,
-        release_spec=release_spec if beam_spec.release_thick else None,
+        release_spec=None,
     )
     rect_thick_ref.movex(thick_offset)
 
@@ -75,7 +84,7 @@ def beam(
         size=(thin_length + thick_offset, width),
         geometry_layer=geometry_layer,
         centered=True,
-        release_spec=release_spec if beam_spec.release_thin else None,
+        release_spec=None,
     )
     rect_thin1_ref.movex(-thin_center + 0.5 * thick_offset)
 
@@ -83,7 +92,7 @@ def beam(
         size=(thin_length - thick_offset, width),
         geometry_layer=geometry_layer,
         centered=True,
-        release_spec=release_spec if beam_spec.release_thin else None,
+        release_spec=None,
     )
     rect_thin2_ref.movex(thin_center + 0.5 * thick_offset)
 
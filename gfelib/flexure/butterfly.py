@@ -19,6 +19,7 @@ def butterfly(
     angle_resolution: float,
     beam_spec: gl.datatypes.BeamSpec | None,
     release_spec: gl.datatypes.ReleaseSpec | None,
+    max_error: float | None = None,
 ) -> gf.Component:
     """Returns a half-butterfly joint (4 beams)
 
@@ -33,6 +34,7 @@ def butterfly(
         angle_resolution: degrees per point for circular geometries
         beam_spec: complex beam specifications, `None` for default
         release_spec: release specifications, `None` for no release
+        max_error: maximum chord error of circular geometries, overrides `angle_resolution` per radius, `None` to use `angle_resolution`
     """
     c = gf.Component()
 
@@ -47,8 +49,12 @@ def butterfly(
         geometry_layer=geometry_layer,
         angle_resolution=angle_resolution,
         release_spec=release_spec if release_inner else None,
+        max_error=max_error,
     )
 
+    if max_error is not None:
+        angle_resolution = gl.utils.angle_resolution_safe(radius1, max_error)
+
     beam_offset = 0.5 * (radius1 + radius2)
     beam = gl.flexure.beam(
         length=radius2
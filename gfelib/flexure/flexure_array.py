@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import numpy as np
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import gfelib as gl
+
+
+@gl.utils.default_cell
+def flexure_array(
+    func: Callable[..., gf.Component],
+    params: Sequence[dict[str, Any]],
+    origins: Sequence[tuple[float, float]],
+    rotations: Sequence[float] | None,
+    mirrors: Sequence[bool] | None,
+) -> gf.Component:
+    """Returns flexures placed at arbitrary positions and orientations, regularly spaced flexures are merged into array references
+
+    Flexures with identical parameters share one cell, so beams of equal dimensions are built once across the array.
+    Positions are snapped to the database grid, e.g. a grid from `gl.utils.grid_lattice(...).tolist()`.
+
+    Args:
+        func: flexure cell function, e.g. `gl.flexure.parallel`
+        params: list of parameter dicts, one per flexure, or a single dict shared by all flexures
+        origins: flexure origins
+        rotations: flexure rotations (unit: degrees), `None` for no rotation
+        mirrors: `True` to mirror a flexure about the x-axis before rotating, `None` for no mirroring
+    """
+    count = len(origins)
+    params = list(params) * count if len(params) == 1 else list(params)
+    rotations = [0.0] * count if rotations is None else list(rotations)
+    mirrors = [False] * count if mirrors is None else list(mirrors)
+    if not len(params) == len(rotations) == len(mirrors) == count:
+        raise ValueError(
+            "Flexure array must have one parameter set and orientation per origin"
+        )
+
+    c = gf.Component()
+    if count == 0:
+        return c
+
+    # one cell per distinct parameter set, built concurrently if `enable_parallel_build` is active
+    keys = [
+        gl.utils.cell_key(module=func.__module__, name=func.__qualname__, params=p)
+        for p in params
+    ]
+    distinct = dict(zip(keys, params))
+    cells = dict(
+        zip(
+            distinct,
+            gl.utils.build_cells(func=func, params=list(distinct.values())),
+        )
+    )
+
+    # flexures sharing a cell and an orientation, merged into array references by `place_instances`
+    groups: dict[tuple[str, float, bool], list[tuple[float, float]]] = {}
+    for key, rotation, mirror, origin in zip(keys, rotations, mirrors, origins):
+        groups.setdefault((key, rotation % 360, mirror), []).append(origin)
+
+    for (key, rotation, mirror), points in groups.items():
+        gl.utils.place_instances(
+            component=c,
+            cell=cells[key],
+            points=np.asarray(points, dtype=float),
+            angle=rotation,
+            mirror=mirror,
+        )
+
+    return c
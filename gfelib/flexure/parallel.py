@@ -37,7 +37,7 @@ def parallel(
         size=(bar_length, bar_width),
         geometry_layer=geometry_layer,
         centered=True,
-        release_spec=release_spec,
+        release_spec=None,
     )
     rect_ref.movey(0.5 * bar_width)
 
@@ -46,8 +46,9 @@ def parallel(
         width=beam_width,
         geometry_layer=geometry_layer,
         beam_spec=beam_spec,
-        release_spec=release_spec,
+        release_spec=None,
     )
+    beam_origins = []
     for pos in beam_pos:
         x_pos = (pos - 0.5) * bar_length
         x_lim = 0.5 * bar_length - 0.5 * beam_width
@@ -55,6 +56,28 @@ def parallel(
         x_pos = x_lim if x_pos > x_lim else x_pos
         beam_ref = c << beam
         beam_ref.rotate(90)
-        beam_ref.move((x_pos, bar_width + 0.5 * beam_length))
+        beam_origins.append((x_pos, bar_width + 0.5 * beam_length))
+        beam_ref.move(beam_origins[-1])
+
+    if release_spec is None:
+        return c
+
+    # the bar and beams are built without holes, their holes are merged into the flexure
+    beam_holes = gl.utils.beam_holes(
+        length=beam_length,
+        width=beam_width,
+        beam_spec=beam_spec,
+        release_spec=release_spec,
+    ).rotated(90)
+    gl.utils.HoleLayout.merge(
+        [
+            gl.utils.rectangle_holes(
+                size=(bar_length, bar_width),
+                centered=True,
+                release_spec=release_spec,
+            ).moved(0, 0.5 * bar_width)
+        ]
+        + [beam_holes.moved(x, y) for x, y in beam_origins]
+    ).place(c)
 
     return c
@@ -3,12 +3,11 @@ from __future__ import annotations
 import gdsfactory as gf
 from collections.abc import Sequence
 import pydantic
-import hashlib
 
 import gfelib as gl
 
 
-class ZCantileverBeam(pydantic.BaseModel):
+class ZCantileverBeam(gl.datatypes.FrozenSpec):
     """Z-cantilever beam specifications
 
     Parameters:
@@ -81,10 +80,6 @@ class ZCantileverBeam(pydantic.BaseModel):
             raise ValueError("Beam isolation region must have y-size > 0")
         return x
 
-    @property
-    def hash(self) -> str:
-        return hashlib.md5(str(self).encode()).hexdigest()
-
 
 @gl.utils.default_cell
 def z_cantilever_half(
@@ -112,18 +107,24 @@ def z_cantilever_half(
     c = gf.Component()
 
     y_offset = 0.5 * clearance if middle_split else 0
-    rect_ref = c << gf.components.rectangle(
+    body = _rectangle_region(
         size=(length, 0.5 * width - y_offset),
+        origin=(0, y_offset),
         layer=geometry_layer,
-        centered=False,
     )
-    rect_ref.movey(y_offset)
 
     beams.sort(key=lambda x: x.get_position(length))
 
+    # gather every region first, each beam applies (moat -> island -> inset) in order
+    removes = []
+    islands = []
     for beam in beams:
         position = beam.get_position(length)
 
+        moat = gf.kdb.Region()
+        island = gf.kdb.Region()
+        inset = gf.kdb.Region()
+
         if beam.isolated:
             isolation_x = beam.get_isolation_x(length)
             isolation_y = beam.get_isolation_y(width)
@@ -136,35 +137,13 @@ def z_cantilever_half(
                 length if isolation_region_e > length else isolation_region_e
             )
 
-            isolation_region = gf.Component()
-            isolation_region_ref = isolation_region << gf.components.rectangle(
+            island = _rectangle_region(
                 size=(isolation_region_e - isolation_region_s, isolation_y),
+                origin=(isolation_region_s, 0.5 * width - isolation_y),
                 layer=geometry_layer,
-                centered=False,
-            )
-            isolation_region_ref.move((isolation_region_s, 0.5 * width - isolation_y))
-            isolation_region.flatten()
-
-            isolation_expand = isolation_region.copy()
-            isolation_expand.offset(layer=geometry_layer, distance=clearance)
-
-            c = gf.boolean(
-                A=c,
-                B=isolation_expand,
-                operation="-",
-                layer=geometry_layer,
-                layer1=geometry_layer,
-                layer2=geometry_layer,
-            )
-
-            c = gf.boolean(
-                A=c,
-                B=isolation_region,
-                operation="|",
-                layer=geometry_layer,
-                layer1=geometry_layer,
-                layer2=geometry_layer,
             )
+            clearance_dbu = gf.kcl.to_dbu(clearance)
+            moat = island.sized(clearance_dbu, clearance_dbu, 2)
 
         if beam.insetted:
             inset_x = beam.get_inset_x(length)
@@ -176,35 +155,52 @@ def z_cantilever_half(
             inset_region_e = position + 0.5 * inset_x
             inset_region_e = length if inset_region_e > length else inset_region_e
 
-            inset_region = gf.Component()
-            inset_region_ref = inset_region << gf.components.rectangle(
+            inset = _rectangle_region(
                 size=(inset_region_e - inset_region_s, inset_y),
+                origin=(inset_region_s, 0.5 * width - inset_y),
                 layer=geometry_layer,
-                centered=False,
             )
-            inset_region_ref.move((inset_region_s, 0.5 * width - inset_y))
-            inset_region.flatten()
 
-            c = gf.boolean(
-                A=c,
-                B=inset_region,
-                operation="-",
-                layer=geometry_layer,
-                layer1=geometry_layer,
-                layer2=geometry_layer,
-            )
+        removes.append(moat + inset)
+        islands.append(island - inset)
 
-    for beam in beams:
+    if all(r.is_empty() for r in removes):
+        rect_ref = c << gf.components.rectangle(
+            size=(length, 0.5 * width - y_offset),
+            layer=geometry_layer,
+            centered=False,
+        )
+        rect_ref.movey(y_offset)
+    else:
+        # an island survives only where no later beam removes material again
+        later = gf.kdb.Region()
+        for i in reversed(range(len(beams))):
+            islands[i] -= later
+            later += removes[i]
+
+        body -= later
+        for island in islands:
+            body += island
+        c.add_polygon(body.merged(), layer=geometry_layer)
+
+    beam_cells = gl.utils.build_cells(
+        func=gl.flexure.beam,
+        params=[
+            dict(
+                length=beam.length,
+                width=beam.width,
+                geometry_layer=geometry_layer,
+                beam_spec=beam.spec,
+                release_spec=release_spec,
+            )
+            for beam in beams
+        ],
+    )
+    for beam, beam_cell in zip(beams, beam_cells):
         position = beam.get_position(length)
         inset = beam.get_inset_y(width) if beam.insetted else 0
 
-        ref = c << gl.flexure.beam(
-            length=beam.length,
-            width=beam.width,
-            geometry_layer=geometry_layer,
-            beam_spec=beam.spec,
-            release_spec=release_spec,
-        )
+        ref = c << beam_cell
         ref.rotate(angle=90, center=(0, 0))
         ref.move(
             (
@@ -220,3 +216,18 @@ def z_cantilever_half(
     )
 
     return c
+
+
+def _rectangle_region(
+    size: gf.typings.Size,
+    origin: tuple[float, float],
+    layer: gf.typings.LayerSpec,
+) -> gf.kdb.Region:
+    # same snapping as placing a `gf.components.rectangle` reference at `origin`
+    rect = gf.components.rectangle(
+        size=size,
+        layer=layer,
+        centered=False,
+    )
+    region = gf.kdb.Region(rect.kdb_cell.begin_shapes_rec(gf.get_layer(layer)))
+    return region.moved(gf.kdb.DVector(*origin).to_itype(rect.kcl.dbu))
@@ -1,4 +1,65 @@
 from __future__ import annotations
 
-from gfelib.utils.default_cell import default_cell
+from gfelib.utils.default_cell import (
+    default_cell,
+    cell_key,
+    enable_disk_cache,
+    disable_disk_cache,
+)
+from gfelib.utils.cell_stats import (
+    CellStats,
+    BuildStats,
+    build_stats,
+    enable_build_stats,
+    disable_build_stats,
+    get_build_stats,
+)
+from gfelib.utils.dependency_graph import (
+    CellNode,
+    CellGraph,
+    cell_graph,
+    enable_cell_graph,
+    disable_cell_graph,
+    get_cell_graph,
+)
+from gfelib.utils.rebuild import rebuild
+from gfelib.utils.regression import LayerDiff, write_golden, compare_golden
+from gfelib.utils.parallel_build import (
+    build_cells,
+    parallel_build,
+    enable_parallel_build,
+    disable_parallel_build,
+)
 from gfelib.utils.sagitta_offset_safe import sagitta_offset_safe
+from gfelib.utils.angle_resolution_safe import angle_resolution_safe
+from gfelib.utils.fracture_sectors import fracture_sectors
+from gfelib.utils.place_instances import snap_dbu, place_instances
+from gfelib.utils.release_lattice import (
+    release_pitch,
+    grid_pitch,
+    grid_axes,
+    grid_lattice,
+    polar_lattice,
+    circle_lattice,
+    ring_lattice,
+    polygon_lattice,
+    boundary_lattice,
+    rotated_lattice,
+    place_holes,
+    place_hole_array,
+    place_hole_tiles,
+    hole_tile,
+)
+from gfelib.utils.hole_layout import (
+    HoleLayout,
+    rectangle_holes,
+    rectangle_ring_holes,
+    beam_holes,
+    circle_holes,
+    ring_holes,
+)
+from gfelib.utils.release_fill import release_fill
+from gfelib.utils.dummy_fill import dummy_fill
+from gfelib.utils.sweep import sweep_grid, sweep
+from gfelib.utils.stream_writer import StreamWriter
+from gfelib.utils.unreleased_islands import unreleased_islands
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+def angle_resolution_safe(
+    radius: float,
+    max_error: float,
+) -> float:
+    """Returns the coarsest angle resolution whose polygon stays within `max_error` of an arc
+
+    Args:
+        radius: arc radius
+        max_error: maximum chord error (sagitta) between polygon and arc
+    """
+    if max_error <= 0:
+        raise ValueError("Maximum chord error must be > 0")
+
+    # inverts the exact polygon offset `radius * (1 - np.cos(angle_resolution * np.pi / 180 / 2))`, see `sagitta_offset_safe`
+    ratio = 1 - max_error / radius if max_error < radius else -1
+    angle_resolution = 2 * np.arccos(ratio) * 180 / np.pi
+
+    # round down to a whole number of points per turn, at least a triangle
+    points = max(np.ceil(360 / angle_resolution), 3)
+    return 360 / points
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import pydantic
+import contextlib
+import pathlib
+import threading
+import time
+from collections.abc import Iterator
+
+# collector used by `default_cell`, `None` keeps the decorator on its fast path
+_ACTIVE: BuildStats | None = None
+
+
+class CellStats(pydantic.BaseModel):
+    """Build statistics of one cell function
+
+    Parameters:
+        calls: number of calls
+        hits: calls answered by a cell cache
+        misses: calls that ran the cell function
+        time_cumulative: wall time spent in calls, including nested cells (unit: seconds)
+        time_self: wall time spent in calls, excluding nested cells (unit: seconds)
+        references: references created by built cells, array references count once
+        polygons: polygons created by built cells, excluding nested cells
+    """
+
+    calls: int = 0
+    hits: int = 0
+    misses: int = 0
+    time_cumulative: float = 0
+    time_self: float = 0
+    references: int = 0
+    polygons: int = 0
+
+
+class BuildStats:
+    """Collects `CellStats` per cell function and self time per call stack"""
+
+    def __init__(self) -> None:
+        self.cells: dict[str, CellStats] = {}
+        self.stacks: dict[tuple[str, ...], float] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _frames(self) -> list[list]:
+        frames = getattr(self._local, "frames", None)
+        if frames is None:
+            frames = self._local.frames = []
+        return frames
+
+    def enter(self, name: str) -> None:
+        # frame: name, start, time in nested cells, built
+        self._frames().append([name, time.perf_counter(), 0.0, False])
+
+    def built(self, c: gf.Component) -> None:
+        frames = self._frames()
+        if not frames:
+            return
+        frames[-1][3] = True
+        polygons = sum(
+            c.kdb_cell.shapes(layer_index).size()
+            for layer_index in c.kcl.layout.layer_indexes()
+        )
+        with self._lock:
+            stats = self.cells.setdefault(frames[-1][0], CellStats())
+            stats.references += c.kdb_cell.child_instances()
+            stats.polygons += polygons
+
+    def exit(self) -> None:
+        frames = self._frames()
+        name, start, nested, built = frames.pop()
+        elapsed = time.perf_counter() - start
+        if frames:
+            frames[-1][2] += elapsed
+
+        stack = tuple(f[0] for f in frames) + (name,)
+        with self._lock:
+            stats = self.cells.setdefault(name, CellStats())
+            stats.calls += 1
+            stats.misses += built
+            stats.hits += not built
+            stats.time_cumulative += elapsed
+            stats.time_self += elapsed - nested
+            self.stacks[stack] = self.stacks.get(stack, 0) + elapsed - nested
+
+    def folded(self) -> str:
+        """Returns self time per call stack in folded format (unit: microseconds), as read by flamegraph.pl and speedscope"""
+        return "".join(
+            f"{';'.join(stack)} {round(t * 1e6)}\n"
+            for stack, t in sorted(self.stacks.items())
+        )
+
+    def write_folded(self, path: str | pathlib.Path) -> None:
+        """Writes `folded` to a file
+
+        Args:
+            path: output file
+        """
+        pathlib.Path(path).write_text(self.folded())
+
+    def table(self) -> str:
+        """Returns a plain text table of all cell functions, slowest self time first"""
+        lines = [
+            f"{'cell':<24}{'calls':>8}{'hits':>8}{'misses':>8}"
+            f"{'cum [s]':>10}{'self [s]':>10}{'refs':>10}{'polygons':>10}"
+        ]
+        for name, s in sorted(self.cells.items(), key=lambda x: -x[1].time_self):
+            lines.append(
+                f"{name:<24}{s.calls:>8}{s.hits:>8}{s.misses:>8}"
+                f"{s.time_cumulative:>10.3f}{s.time_self:>10.3f}"
+                f"{s.references:>10}{s.polygons:>10}"
+            )
+        return "\n".join(lines)
+
+
+def enable_build_stats() -> BuildStats:
+    """Starts recording build statistics in `default_cell`, returns the collector"""
+    global _ACTIVE
+    _ACTIVE = BuildStats()
+    return _ACTIVE
+
+
+def disable_build_stats() -> None:
+    """Stops recording build statistics"""
+    global _ACTIVE
+    _ACTIVE = None
+
+
+def get_build_stats() -> BuildStats | None:
+    """Returns the active collector, `None` when disabled"""
+    return _ACTIVE
+
+
+@contextlib.contextmanager
+def build_stats() -> Iterator[BuildStats]:
+    """Records build statistics of every gfelib cell built inside the `with` block
+
+    ```python
+    with gl.utils.build_stats() as stats:
+        gl.device.chip_border(...)
+    print(stats.table())
+    stats.write_folded("build.folded")
+    ```
+    """
+    global _ACTIVE
+    previous = _ACTIVE
+    _ACTIVE = BuildStats()
+    try:
+        yield _ACTIVE
+    finally:
+        _ACTIVE = previous
@@ -2,6 +2,267 @@ from __future__ import annotations
 
 import gdsfactory as gf
 
-default_cell = gf._cell.override_defaults(
+import pydantic
+import hashlib
+import functools
+import inspect
+import json
+import os
+import pathlib
+from collections.abc import Callable
+from typing import Any
+
+from gfelib.datatypes.frozen_spec import FrozenSpec
+from gfelib.utils import cell_stats
+from gfelib.utils import dependency_graph
+
+_cell = gf._cell.override_defaults(
     gf.cell, with_module_name=True, check_instances=False
 )
+
+# on-disk cell cache, see `enable_disk_cache`
+_DISK_CACHE: dict[str, Any] = {
+    "path": None,
+    "max_size": 0,
+    "resolved": set(),
+}
+
+
+def default_cell(func: Callable[..., gf.Component]) -> Callable[..., gf.Component]:
+    """gdsfactory cell decorator used by all gfelib components, with an optional on-disk cache and build statistics
+
+    Args:
+        func: component function
+    """
+
+    @functools.wraps(func)
+    def build(*args: Any, **kwargs: Any) -> gf.Component:
+        c = func(*args, **kwargs)
+        if cell_stats._ACTIVE is not None:
+            cell_stats._ACTIVE.built(c)
+        if dependency_graph._ACTIVE is not None:
+            dependency_graph._ACTIVE.built()
+        return c
+
+    # parameters left at their default stay out of cell names, so adding an optional parameter keeps existing names
+    signature = inspect.signature(func)
+    build.__signature__ = signature.replace(
+        parameters=[
+            p.replace(default=inspect.Parameter.empty)
+            for p in signature.parameters.values()
+        ]
+    )
+    cell_func = _cell(build)
+
+    def resolve(*args: Any, **kwargs: Any) -> gf.Component:
+        if _DISK_CACHE["path"] is None:
+            return cell_func(*args, **kwargs)
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = cell_key(
+            module=func.__module__,
+            name=func.__qualname__,
+            params=bound.arguments,
+        )
+        if key in _DISK_CACHE["resolved"]:
+            return cell_func(*args, **kwargs)
+
+        path = _DISK_CACHE["path"] / f"{key}.gds"
+        if path.exists():
+            try:
+                # the layout cache of `gf.cell` picks up the loaded cell by name
+                _read_cells(path)
+                os.utime(path)
+            except (OSError, RuntimeError):
+                path.unlink(missing_ok=True)
+
+        c = cell_func(*args, **kwargs)
+
+        if not path.exists():
+            _disk_cache_store(c, path)
+        _DISK_CACHE["resolved"].add(key)
+        return c
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> gf.Component:
+        # equal specs share one object, cache keys then hash and compare them by identity or fingerprint
+        args = tuple(_interned(v) for v in args)
+        kwargs = {
+            k: _interned(v)
+            for k, v in kwargs.items()
+            if not _is_default(signature.parameters.get(k), v)
+        }
+        stats = cell_stats._ACTIVE
+        graph = dependency_graph._ACTIVE
+        if stats is None and graph is None:
+            return resolve(*args, **kwargs)
+
+        if stats is not None:
+            stats.enter(func.__name__)
+        if graph is not None:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            graph.enter(
+                function=f"{func.__module__}.{func.__qualname__}",
+                key=cell_key(
+                    module=func.__module__,
+                    name=func.__qualname__,
+                    params=bound.arguments,
+                ),
+                params=_canonical(bound.arguments),
+            )
+        c = None
+        try:
+            c = resolve(*args, **kwargs)
+            return c
+        finally:
+            if graph is not None:
+                graph.exit(c)
+            if stats is not None:
+                stats.exit()
+
+    return wrapper
+
+
+def cell_key(
+    module: str,
+    name: str,
+    params: dict[str, Any],
+) -> str:
+    """Returns the content address of a cell, salted with the gfelib version
+
+    Args:
+        module: cell function module
+        name: cell function name
+        params: cell function parameters, including defaults
+    """
+    content = json.dumps(
+        {
+            "salt": _version_salt(),
+            "module": module,
+            "name": name,
+            "params": _canonical(params),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def enable_disk_cache(
+    path: str | pathlib.Path,
+    max_size: int = 2**30,
+) -> None:
+    """Loads gfelib cells from, and stores them to, a local directory
+
+    Args:
+        path: cache directory, created if missing
+        max_size: cache size limit in bytes, least recently used cells are evicted first
+    """
+    path = pathlib.Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    _DISK_CACHE["path"] = path
+    _DISK_CACHE["max_size"] = max_size
+    _DISK_CACHE["resolved"].clear()
+
+
+def disable_disk_cache() -> None:
+    """Stops using the on-disk cell cache, cached files are kept"""
+    _DISK_CACHE["path"] = None
+    _DISK_CACHE["resolved"].clear()
+
+
+def _disk_cache_store(c: gf.Component, path: pathlib.Path) -> None:
+    # write to a temporary file first, concurrent processes may share the cache
+    tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.gds")
+    try:
+        c.write_gds(gdspath=tmp)
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        return
+
+    # files evicted by another process meanwhile are skipped
+    files = []
+    for f in _DISK_CACHE["path"].glob("*.gds"):
+        try:
+            stat = f.stat()
+        except FileNotFoundError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, f))
+    files.sort(key=lambda entry: entry[0])
+
+    size = sum(file_size for _, file_size, _ in files)
+    for _, file_size, f in files:
+        if size <= _DISK_CACHE["max_size"]:
+            break
+        size -= file_size
+        f.unlink(missing_ok=True)
+
+
+def _read_cells(path: str | pathlib.Path) -> None:
+    # loads the cells of a GDSII file missing from `gf.kcl`, cells already in the layout are kept as they are,
+    # `gf.kcl.read` would add the file content to them and fails on locked cells
+    layout = gf.kdb.Layout()
+    layout.read(str(path))
+    existing = {cell.name for cell in gf.kcl.layout.each_cell()}
+    new = [cell for cell in layout.each_cell() if cell.name not in existing]
+    if not new:
+        return
+    names = [cell.name for cell in sorted(new, key=lambda c: c.hierarchy_levels())]
+
+    # references to skipped cells are bound to the existing cells of the same name
+    options = gf.kdb.LoadLayoutOptions()
+    options.cell_conflict_resolution = (
+        gf.kdb.LoadLayoutOptions.CellConflictResolution.SkipNewCell
+    )
+    gf.kcl.layout.read_bytes(layout.write_bytes(gf.kdb.SaveLayoutOptions()), options)
+
+    # registers the cross sections of the ports, then the new cells with their ports and settings, bottom-up
+    gf.kcl.get_meta_data()
+    for name in names:
+        _ = gf.kcl[name]
+
+
+@functools.cache
+def _version_salt() -> str:
+    # any change to the gfelib sources or to gdsfactory invalidates the cache
+    root = pathlib.Path(__file__).resolve().parents[1]
+    h = hashlib.sha256(gf.__version__.encode())
+    for f in sorted(root.rglob("*.py")):
+        h.update(str(f.relative_to(root)).encode())
+        h.update(f.read_bytes())
+    return h.hexdigest()
+
+
+def _is_default(parameter: inspect.Parameter | None, value: Any) -> bool:
+    if parameter is None or parameter.default is inspect.Parameter.empty:
+        return False
+    default = parameter.default
+    return value is default or (type(value) is type(default) and value == default)
+
+
+def _interned(value: Any) -> Any:
+    if isinstance(value, FrozenSpec):
+        return value.interned()
+    if isinstance(value, (list, tuple)) and any(
+        isinstance(v, FrozenSpec) for v in value
+    ):
+        return type(value)(_interned(v) for v in value)
+    return value
+
+
+def _canonical(value: Any) -> Any:
+    if isinstance(value, FrozenSpec):
+        return [type(value).__name__, value.fingerprint]
+    if isinstance(value, pydantic.BaseModel):
+        return [type(value).__name__, _canonical(value.model_dump())]
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        return value
+    if callable(value):
+        return f"{value.__module__}.{value.__qualname__}"
+    return str(value)
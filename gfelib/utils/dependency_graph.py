@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import pydantic
+import contextlib
+import json
+import pathlib
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+# recorder used by `default_cell`, `None` keeps the decorator on its fast path
+_ACTIVE: CellGraph | None = None
+
+
+class CellNode(pydantic.BaseModel):
+    """Dependencies of one gfelib cell
+
+    Parameters:
+        function: cell function, as `module.qualname`
+        key: content address of the cell, see `cell_key`
+        params: canonical cell function parameters, including defaults, specs by fingerprint
+        children: names of the gfelib cells instantiated by the cell function, `None` if unknown
+        built: `True` if the cell function ran in the recorded build, `False` if a cell cache answered
+    """
+
+    function: str
+    key: str
+    params: dict[str, Any]
+    children: list[str] | None
+    built: bool
+
+
+class CellGraph:
+    """Records which gfelib cells each cell instantiates and which parameter values it depends on
+
+    Args:
+        previous: graph of an earlier build, children of cells answered by a cache are taken from it
+    """
+
+    def __init__(self, previous: CellGraph | None = None) -> None:
+        self.nodes: dict[str, CellNode] = {}
+        self.roots: list[str] = []
+        self.previous = previous
+        # version salt of the recorded build, see `rebuild`
+        self.salt: str | None = None
+        self._frames: list[list] = []
+
+    def enter(self, function: str, key: str, params: dict[str, Any]) -> None:
+        # frame: function, key, params, children, built
+        self._frames.append([function, key, params, [], False])
+
+    def built(self) -> None:
+        if self._frames:
+            self._frames[-1][4] = True
+
+    def exit(self, c: gf.Component | None) -> None:
+        function, key, params, children, built = self._frames.pop()
+        if c is None:
+            return
+
+        name = c.name
+        if not built:
+            known = self.nodes.get(name)
+            if known is None and self.previous is not None:
+                known = self.previous.nodes.get(name)
+                if known is not None:
+                    self._reuse(known.children or [])
+            children = None if known is None else known.children
+        known = self.nodes.get(name)
+        self.nodes[name] = CellNode(
+            function=function,
+            key=key,
+            params=params,
+            children=children,
+            built=built or (known is not None and known.built),
+        )
+
+        if self._frames:
+            if name not in self._frames[-1][3]:
+                self._frames[-1][3].append(name)
+        elif name not in self.roots:
+            self.roots.append(name)
+
+    def _reuse(self, names: list[str]) -> None:
+        # cells of the previous graph below a cell answered by a cache, none of them ran their cell function
+        for name in names:
+            if name in self.nodes or name not in self.previous.nodes:
+                continue
+            node = self.previous.nodes[name]
+            self.nodes[name] = node.model_copy(update={"built": False})
+            self._reuse(node.children or [])
+
+    def built_cells(self) -> list[str]:
+        """Returns the names of the cells built by their cell function"""
+        return [name for name, node in self.nodes.items() if node.built]
+
+    def reused_cells(self) -> list[str]:
+        """Returns the names of the cells answered by a cell cache"""
+        return [name for name, node in self.nodes.items() if not node.built]
+
+    def parents(self, name: str) -> list[str]:
+        """Returns the names of the cells instantiating a cell
+
+        Args:
+            name: cell name
+        """
+        return [
+            parent
+            for parent, node in self.nodes.items()
+            if node.children is not None and name in node.children
+        ]
+
+    def ancestors(self, names: Iterable[str]) -> set[str]:
+        """Returns the cells and every cell instantiating them, directly or not
+
+        Args:
+            names: cell names
+        """
+        found = set()
+        pending = list(names)
+        while pending:
+            name = pending.pop()
+            if name in found:
+                continue
+            found.add(name)
+            pending.extend(self.parents(name))
+        return found
+
+    def changes(self, previous: CellGraph) -> dict[str, list[str]]:
+        """Returns the cells missing from an earlier build, each with the parameters that differ from the closest earlier cell of the same function
+
+        Args:
+            previous: graph of the earlier build
+        """
+        keys = {node.key for node in previous.nodes.values()}
+        changes = {}
+        for name, node in self.nodes.items():
+            if node.key in keys:
+                continue
+            diffs = [
+                sorted(
+                    k
+                    for k in node.params.keys() | other.params.keys()
+                    if node.params.get(k) != other.params.get(k)
+                )
+                for other in previous.nodes.values()
+                if other.function == node.function
+            ]
+            changes[name] = min(diffs, key=len) if diffs else []
+        return changes
+
+    def write_json(self, path: str | pathlib.Path) -> None:
+        """Writes the graph to a JSON file
+
+        Args:
+            path: output file
+        """
+        content = {
+            "salt": self.salt,
+            "roots": self.roots,
+            "nodes": {name: node.model_dump() for name, node in self.nodes.items()},
+        }
+        pathlib.Path(path).write_text(json.dumps(content, indent=1) + "\n")
+
+    @classmethod
+    def read_json(cls, path: str | pathlib.Path) -> CellGraph:
+        """Returns a graph written by `write_json`
+
+        Args:
+            path: input file
+        """
+        content = json.loads(pathlib.Path(path).read_text())
+        graph = cls()
+        graph.salt = content["salt"]
+        graph.roots = content["roots"]
+        graph.nodes = {
+            name: CellNode(**node) for name, node in content["nodes"].items()
+        }
+        return graph
+
+
+def enable_cell_graph(previous: CellGraph | None = None) -> CellGraph:
+    """Starts recording the cell dependency graph in `default_cell`, returns the recorder
+
+    Args:
+        previous: graph of an earlier build, see `CellGraph`
+    """
+    global _ACTIVE
+    _ACTIVE = CellGraph(previous=previous)
+    return _ACTIVE
+
+
+def disable_cell_graph() -> None:
+    """Stops recording the cell dependency graph"""
+    global _ACTIVE
+    _ACTIVE = None
+
+
+def get_cell_graph() -> CellGraph | None:
+    """Returns the active recorder, `None` when disabled"""
+    return _ACTIVE
+
+
+@contextlib.contextmanager
+def cell_graph(previous: CellGraph | None = None) -> Iterator[CellGraph]:
+    """Records the dependency graph of every gfelib cell built inside the `with` block
+
+    ```python
+    with gl.utils.cell_graph() as graph:
+        gl.flexure.parallel(...)
+    print(graph.built_cells())
+    ```
+
+    Args:
+        previous: graph of an earlier build, see `CellGraph`
+    """
+    global _ACTIVE
+    active = _ACTIVE
+    _ACTIVE = CellGraph(previous=previous)
+    try:
+        yield _ACTIVE
+    finally:
+        _ACTIVE = active
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import numpy as np
+from collections.abc import Sequence
+
+import gfelib as gl
+
+
+def dummy_fill(
+    component: gf.Component,
+    size: gf.typings.Size,
+    centered: bool,
+    fill_layer: gf.typings.LayerSpec,
+    exclude_layers: Sequence[gf.typings.LayerSpec],
+    pitch: float,
+    density: float,
+    keep_out: float,
+) -> None:
+    """Inserts square dummy fill tiles on a regular grid wherever they keep `keep_out` from the existing geometry along x and y, as array references
+
+    The tile side is `pitch * sqrt(density)`, so empty areas reach the pattern density `density`.
+    Every grid site is tested at once by rasterizing the geometry onto the tile grid with tiles grown by `keep_out`, the geometry itself is never sized,
+    free sites are then merged into array references by `place_instances`.
+    Only the layers in `exclude_layers` are flattened, release holes lie inside the geometry they release and need not be listed,
+    klayout skips every cell without shapes on those layers, so dies with millions of hole references stay fast.
+
+    Args:
+        component: component to insert the tiles into, must not be locked
+        size: fill area width and height, e.g. `size - 2 * width` of `gl.device.chip_border`
+        centered: `True` sets center of the fill area to (0, 0), `False` sets south-west to (0, 0)
+        fill_layer: fill tile polygon layer
+        exclude_layers: layers whose polygons the tiles keep away from
+        pitch: tile pitch
+        density: pattern density of the fill tiles, between 0 and 1
+        keep_out: minimum x or y distance between a tile and the existing geometry
+    """
+    if not 0 < density <= 1:
+        raise ValueError("Fill density must be > 0 and <= 1")
+
+    dbu = component.kcl.dbu
+    step = int(round(pitch / dbu))
+    # even number of database units, so centered tiles stay on the grid
+    side = 2 * int(np.floor(0.5 * np.sqrt(density) * pitch / dbu))
+    width, height = (int(round(length / dbu)) for length in size)
+    if side <= 0 or side > min(width, height):
+        return
+
+    # tile grid centered on the fill area
+    counts = [(length - side) // step + 1 for length in (width, height)]
+    left, bottom = (
+        (-length // 2 if centered else 0) + (length - ((n - 1) * step + side)) // 2
+        for length, n in zip((width, height), counts)
+    )
+
+    geometry = gf.kdb.Region()
+    for layer in exclude_layers:
+        geometry.insert(component.kdb_cell.begin_shapes_rec(gf.get_layer(layer)))
+
+    # a site is free if the tile grown by `keep_out` does not overlap the geometry,
+    # rasterizing needs pixels no larger than the pitch, so the grown tile is split into sub-pixels, one raster pass each
+    margin = int(round(keep_out / dbu))
+    grown = side + 2 * margin
+    pieces = -(-grown // step)
+    bounds = [-margin + (j * grown) // pieces for j in range(pieces + 1)]
+    overlap = np.zeros((counts[1], counts[0]))
+    for x0, x1 in zip(bounds[:-1], bounds[1:]):
+        for y0, y1 in zip(bounds[:-1], bounds[1:]):
+            overlap += np.array(
+                geometry.rasterize(
+                    gf.kdb.Point(left + x0, bottom + y0),
+                    gf.kdb.Vector(step, step),
+                    gf.kdb.Vector(x1 - x0, y1 - y0),
+                    counts[0],
+                    counts[1],
+                )
+            ).reshape(counts[1], counts[0])
+    free = overlap == 0
+    if not free.any():
+        return
+
+    tile = gl.basic.rectangle(
+        size=(side * dbu, side * dbu),
+        geometry_layer=fill_layer,
+        centered=True,
+        release_spec=None,
+    )
+    rows, columns = np.nonzero(free)
+    gl.utils.place_instances(
+        component=component,
+        cell=tile,
+        points=np.stack(
+            (
+                left + columns * step + side // 2,
+                bottom + rows * step + side // 2,
+            ),
+            axis=-1,
+        )
+        * dbu,
+    )
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+def fracture_sectors(
+    steps: int,
+    step: float,
+    max_points: int,
+    wedge: bool,
+) -> list[tuple[float, int, float]]:
+    """Returns the sectors `(start, count, rotation)` splitting an arc of `steps` segments starting at 0 degrees, each polygon with at most `max_points` vertices
+
+    The arc is split at every multiple of 90 degrees if it falls on a vertex, and each quadrant is split evenly,
+    so sectors of different quadrants are identical up to a `rotation` that maps the database grid onto itself and can share one cell.
+    `start` is the sector start angle before `rotation`, sector vertices are at `start + i * step` for `i` from `0` to `count`.
+
+    Args:
+        steps: number of arc segments
+        step: angle between arc vertices (unit: degrees)
+        max_points: maximum number of vertices per sector polygon
+        wedge: `True` for pie sectors with a single center vertex, `False` for annular sectors
+    """
+    # vertices per sector: both arcs, or the outer arc and the center
+    per_sector = max_points - 2 if wedge else max_points // 2 - 1
+    if per_sector < 1:
+        raise ValueError(
+            "Sector must have max_points >= 3, or >= 4 for annular sectors"
+        )
+
+    quarter = 90 / step
+    if abs(quarter - np.round(quarter)) < 1e-9 and np.round(quarter) >= 1:
+        quarter = int(np.round(quarter))
+    else:
+        quarter = steps
+
+    sectors = []
+    for lo in range(0, steps, quarter):
+        hi = min(lo + quarter, steps)
+        parts = -(-(hi - lo) // per_sector)
+        bounds = [lo + (i * (hi - lo)) // parts for i in range(parts + 1)]
+        # quadrant `k` is quadrant 0 rotated by `90 * k` degrees
+        k = lo // quarter
+        for a, b in zip(bounds[:-1], bounds[1:]):
+            sectors.append(((a - k * quarter) * step, b - a, 90.0 * k))
+    return sectors
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import concurrent.futures
+import contextlib
+import os
+import pathlib
+import tempfile
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from typing import Any
+
+from gfelib.utils.default_cell import _read_cells, cell_key
+
+# worker pool shared by all components, see `enable_parallel_build`
+_PARALLEL: dict[str, Any] = {
+    "executor": None,
+}
+
+
+def _forget_executor() -> None:
+    _PARALLEL["executor"] = None
+
+
+# forked processes, e.g. pool or sweep workers, inherit the pool but cannot submit to it, they build serially
+os.register_at_fork(after_in_child=_forget_executor)
+
+
+def enable_parallel_build(
+    max_workers: int | None = None,
+    initializer: Callable[[], None] | None = None,
+) -> None:
+    """Builds independent sub-cells of gfelib components on a process pool, see `build_cells`
+
+    Args:
+        max_workers: number of worker processes, `None` for one per core
+        initializer: called once in every worker process before building, e.g. to activate the PDK
+    """
+    disable_parallel_build()
+    _PARALLEL["executor"] = concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=initializer,
+    )
+
+
+def disable_parallel_build() -> None:
+    """Builds sub-cells in this process again and shuts the worker pool down"""
+    executor = _PARALLEL["executor"]
+    _PARALLEL["executor"] = None
+    if executor is not None:
+        executor.shutdown()
+
+
+@contextlib.contextmanager
+def parallel_build(
+    max_workers: int | None = None,
+    initializer: Callable[[], None] | None = None,
+) -> Iterator[None]:
+    """Builds independent sub-cells on a process pool within a `with` block
+
+    ```python
+    with gl.utils.parallel_build(max_workers=4):
+        c = gl.actuator.rotator_gear(...)
+    ```
+
+    Args:
+        max_workers: number of worker processes, `None` for one per core
+        initializer: called once in every worker process before building, e.g. to activate the PDK
+    """
+    enable_parallel_build(max_workers=max_workers, initializer=initializer)
+    try:
+        yield
+    finally:
+        disable_parallel_build()
+
+
+def build_cells(
+    func: Callable[..., gf.Component],
+    params: Sequence[Mapping[str, Any]],
+) -> list[gf.Component]:
+    """Returns the cells `func(**p)` for every parameter dict, built concurrently if `enable_parallel_build` is active
+
+    Distinct cells are built in worker processes and loaded back by cell name, then resolved in call order by the cell cache,
+    so names and geometry match a serial build.
+
+    Args:
+        func: gfelib cell function, must be importable by the worker processes
+        params: list of parameter dicts, one per cell
+    """
+    params = [dict(p) for p in params]
+    executor = _PARALLEL["executor"]
+
+    if executor is not None and len(params) > 1:
+        distinct = {
+            cell_key(module=func.__module__, name=func.__qualname__, params=p): p
+            for p in params
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            futures = [
+                executor.submit(_build_cell, func, p, tmpdir) for p in distinct.values()
+            ]
+            # the layout cache of `gf.cell` picks up the loaded cells by name, existing cells are kept
+            for future in futures:
+                _read_cells(future.result())
+
+    return [func(**p) for p in params]
+
+
+def _build_cell(
+    func: Callable[..., gf.Component],
+    params: dict[str, Any],
+    tmpdir: str,
+) -> pathlib.Path:
+    c = func(**params)
+    path = pathlib.Path(tmpdir) / f"{os.getpid()}_{c.name}.gds"
+    c.write_gds(gdspath=path)
+    return path
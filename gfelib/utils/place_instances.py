@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import numpy as np
+
+
+def snap_dbu(values: np.ndarray, dbu: float) -> np.ndarray:
+    """Returns coordinates rounded to the database grid half away from zero, same as klayout reference displacements (unit: database units)
+
+    Args:
+        values: coordinates (unit: um)
+        dbu: database unit
+    """
+    # multiplied by the inverse like klayout, dividing rounds some half-unit ties the other way
+    values = np.asarray(values, dtype=float) * (1 / dbu)
+    return (np.sign(values) * np.floor(np.abs(values) + 0.5)).astype(np.int64)
+
+
+def place_instances(
+    component: gf.Component,
+    cell: gf.Component,
+    points: np.ndarray,
+    angle: float = 0,
+    mirror: bool = False,
+) -> None:
+    """Inserts a reference to `cell` at every point, evenly spaced points are merged into array references
+
+    Points are snapped with `snap_dbu`, so every reference lands exactly where a single reference at that point would.
+    Rows of points are split into evenly spaced runs, also interleaved ones, e.g. every other hole of a lattice whose pitch alternates by a database unit,
+    then equal runs of different rows are stacked into 2D arrays the same way.
+
+    Args:
+        component: component to insert the references into, must not be locked
+        cell: referenced component
+        points: (N, 2) array of reference origins
+        angle: rotation of every reference (unit: degrees)
+        mirror: `True` to mirror every reference about the x-axis before rotating
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    if len(points) == 0:
+        return
+    p = snap_dbu(points, component.kcl.dbu)
+    p = p[np.lexsort((p[:, 0], p[:, 1]))]
+    p = p[np.r_[True, np.any(p[1:] != p[:-1], axis=1)]]
+
+    # runs along every row, then equal runs stacked along y
+    ys, row = np.unique(p[:, 1], return_inverse=True)
+    row, x0, sx, nx = _progressions(groups=row, values=p[:, 0])
+    runs, run = np.unique(
+        np.stack((x0, sx, nx), axis=-1),
+        axis=0,
+        return_inverse=True,
+    )
+    run, y0, sy, ny = _progressions(groups=run, values=ys[row])
+    x0, sx, nx = runs[run].T
+
+    kdb_cell = component.kdb_cell
+    cell_index = cell.cell_index()
+    for x, y, step_x, count_x, step_y, count_y in zip(
+        x0.tolist(),
+        y0.tolist(),
+        sx.tolist(),
+        nx.tolist(),
+        sy.tolist(),
+        ny.tolist(),
+    ):
+        trans = gf.kdb.ICplxTrans(1, angle, mirror, x, y)
+        if count_x * count_y == 1:
+            kdb_cell.insert(gf.kdb.CellInstArray(cell_index, trans))
+        else:
+            kdb_cell.insert(
+                gf.kdb.CellInstArray(
+                    cell_index,
+                    trans,
+                    gf.kdb.Vector(step_x, 0),
+                    gf.kdb.Vector(0, step_y),
+                    count_x,
+                    count_y,
+                )
+            )
+
+
+def _progressions(
+    groups: np.ndarray,
+    values: np.ndarray,
+    max_stride: int = 4,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # covers the distinct integer values of every group with evenly spaced runs, returns group, first value, step and count of every run,
+    # every `stride`-th value of a group forms one sequence, the stride giving the fewest runs wins
+    order = np.lexsort((values, groups))
+    groups, values = groups[order], values[order]
+    starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+    position = np.arange(len(values)) - np.repeat(
+        starts, np.diff(np.r_[starts, len(values)])
+    )
+
+    best = None
+    for stride in range(1, max_stride + 1):
+        sequence = groups * stride + position % stride
+        order = np.argsort(sequence, kind="stable")
+        sequence, first, step, count = _runs(sequence[order], values[order])
+        if best is None or len(first) < len(best[1]):
+            best = (sequence // stride, first, step, count)
+        if len(first) == len(starts):
+            break
+    return best
+
+
+def _runs(
+    sequence: np.ndarray,
+    values: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # splits values sorted within each sequence into runs of equal spacing, same as extending each run greedily from its first two values
+    new = np.r_[True, sequence[1:] != sequence[:-1]]
+    delta = np.r_[0, np.diff(values)]
+    linked = ~new
+    change = linked & np.r_[False, linked[:-1]] & (delta != np.r_[0, delta[:-1]])
+
+    # a spacing change ends a run, the next value starts one with whatever spacing follows,
+    # so along consecutive changes every other link is cut
+    index = np.arange(len(values))
+    block = change & ~np.r_[False, change[:-1]]
+    position = index - np.maximum.accumulate(np.where(block, index, 0))
+    cut = change & (position % 2 == 0)
+
+    first = np.flatnonzero(new | cut)
+    count = np.diff(np.r_[first, len(values)])
+    step = np.where(count > 1, delta[np.minimum(first + 1, len(values) - 1)], 0)
+    return sequence[first], values[first], step, count
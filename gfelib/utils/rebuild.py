@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import pathlib
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+from gfelib.utils.default_cell import _read_cells, _version_salt
+from gfelib.utils.dependency_graph import CellGraph, cell_graph
+
+
+def rebuild(
+    func: Callable[..., gf.Component],
+    params: Mapping[str, Any],
+    path: str | pathlib.Path,
+) -> tuple[gf.Component, CellGraph]:
+    """Returns `func(**params)` and its dependency graph, rebuilding only the cells changed since the build stored at `path`
+
+    The previous layout is loaded first, unchanged cells keep their names and are re-linked by the layout cache of `gf.cell`,
+    so only cells with changed parameters and their parents run their cell function, e.g. a `BeamSpec` edit rebuilds the `beam` cells and their parents.
+    The result is written back to `path`, the dependency graph to `path` with a `.json` suffix.
+    A build stored by another gfelib or gdsfactory version is discarded.
+
+    Args:
+        func: gfelib cell function
+        params: cell function parameters
+        path: GDSII file of the previous and of the new build
+    """
+    path = pathlib.Path(path)
+    graph_path = path.with_suffix(".json")
+
+    previous = None
+    loaded: set[str] = set()
+    if path.exists() and graph_path.exists():
+        previous = CellGraph.read_json(graph_path)
+        if previous.salt != _version_salt():
+            previous = None
+        else:
+            # cells already in the layout are kept
+            before = {cell.name for cell in gf.kcl.layout.each_cell()}
+            _read_cells(path)
+            loaded = {cell.name for cell in gf.kcl.layout.each_cell()} - before
+
+    with cell_graph(previous=previous) as graph:
+        c = func(**params)
+    graph.salt = _version_salt()
+
+    _release_unused(names=loaded - set(graph.nodes) - {c.name}, loaded=loaded)
+
+    c.write_gds(gdspath=path)
+    graph.write_json(graph_path)
+    return c, graph
+
+
+def _release_unused(names: Iterable[str], loaded: set[str]) -> None:
+    # delete loaded cells that no cell instantiates anymore, together with the loaded sub-cells only used by them
+    layout = gf.kcl.layout
+    candidates = set()
+    for name in names:
+        cell = layout.cell(name)
+        if cell is not None:
+            candidates.add(cell.cell_index())
+            candidates.update(
+                ci for ci in cell.called_cells() if layout.cell(ci).name in loaded
+            )
+
+    release = set()
+    for ci in layout.each_cell_top_down():
+        if ci in candidates and all(
+            p in release for p in layout.cell(ci).each_parent_cell()
+        ):
+            release.add(ci)
+    if release:
+        gf.kcl.delete_cells(sorted(release))
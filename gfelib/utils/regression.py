@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import pydantic
+import concurrent.futures
+import hashlib
+import json
+import pathlib
+import tempfile
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+# layouts read by `_xor_tile`, one per file and process
+_LAYOUTS: dict[str, gf.kdb.Layout] = {}
+
+
+class LayerDiff(pydantic.BaseModel):
+    """Geometric difference of one cell on one layer against the golden layout
+
+    Parameters:
+        cell: name of the cell in the current build
+        layer: layer and datatype
+        area: area of the XOR of both layouts (unit: um^2)
+        regions: bounding boxes `(x0, y0, x1, y1)` of the differing polygons, split at tile borders
+    """
+
+    cell: str
+    layer: tuple[int, int]
+    area: float
+    regions: list[tuple[float, float, float, float]]
+
+
+def write_golden(
+    calls: Sequence[tuple[Callable[..., gf.Component], Mapping[str, Any]]],
+    path: str | pathlib.Path,
+) -> None:
+    """Writes the cells `func(**params)` of every call to a golden GDSII file, with their per-layer fingerprints in a `.json` file next to it
+
+    Args:
+        calls: cell function and parameter dict of every cell
+        path: golden GDSII file
+    """
+    path = pathlib.Path(path)
+    cells = [func(**params) for func, params in calls]
+    _write_cells(cells=cells, path=path)
+
+    layout = gf.kcl.layout
+    content = [
+        {"name": c.name, "layers": _fingerprints(layout, c.kdb_cell)} for c in cells
+    ]
+    path.with_suffix(".json").write_text(json.dumps(content, indent=1) + "\n")
+
+
+def compare_golden(
+    calls: Sequence[tuple[Callable[..., gf.Component], Mapping[str, Any]]],
+    path: str | pathlib.Path,
+    tile_size: float = 1000,
+    max_workers: int | None = None,
+) -> list[LayerDiff]:
+    """Returns the layers of every cell `func(**params)` that differ from the golden layout written by `write_golden`, empty if none differ
+
+    Calls are matched to golden cells by position, so renamed cells are still compared.
+    A layer whose fingerprint, a hash of its shapes and of the placements of every sub-cell, equals the golden one is identical and skipped,
+    every other layer is cut into tiles of `tile_size` and XOR-ed tile by tile on a process pool.
+
+    Args:
+        calls: cell function and parameter dict of every cell, in the order given to `write_golden`
+        path: golden GDSII file
+        tile_size: maximum tile width and height
+        max_workers: number of worker processes, `None` for one per core, `1` to compare in this process
+    """
+    path = pathlib.Path(path)
+    golden = json.loads(path.with_suffix(".json").read_text())
+    if len(golden) != len(calls):
+        raise ValueError(
+            f"Golden layout has {len(golden)} cells, got {len(calls)} calls"
+        )
+
+    cells = [func(**params) for func, params in calls]
+    layout = gf.kcl.layout
+    dbu = layout.dbu
+    step = int(round(tile_size / dbu))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        current = pathlib.Path(tmpdir) / "current.gds"
+        _write_cells(cells=cells, path=current)
+
+        # one task per tile of every changed layer
+        tasks = []
+        for c, entry in zip(cells, golden):
+            layers = _fingerprints(layout, c.kdb_cell)
+            for name in sorted(layers.keys() | entry["layers"].keys()):
+                if layers.get(name) == entry["layers"].get(name):
+                    continue
+                layer = tuple(int(i) for i in name.split("/"))
+                bbox = _bbox(str(current), c.name, layer) + _bbox(
+                    str(path), entry["name"], layer
+                )
+                for left in range(bbox.left, bbox.right, step):
+                    for bottom in range(bbox.bottom, bbox.top, step):
+                        tasks.append(
+                            (
+                                c.name,
+                                layer,
+                                (str(current), c.name),
+                                (str(path), entry["name"]),
+                                (left, bottom, left + step, bottom + step),
+                            )
+                        )
+
+        args = [task[2:] + (task[1],) for task in tasks]
+        try:
+            if max_workers == 1 or len(args) <= 1:
+                results = [_xor_tile(*a) for a in args]
+            else:
+                with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=max_workers
+                ) as executor:
+                    results = list(executor.map(_xor_tile, *zip(*args)))
+        finally:
+            _LAYOUTS.clear()
+
+    diffs: dict[tuple[str, tuple[int, int]], LayerDiff] = {}
+    for (cell, layer, *_), (area, boxes) in zip(tasks, results):
+        if area == 0:
+            continue
+        diff = diffs.setdefault(
+            (cell, layer),
+            LayerDiff(cell=cell, layer=layer, area=0, regions=[]),
+        )
+        diff.area += area * dbu**2
+        diff.regions.extend(tuple(v * dbu for v in box) for box in boxes)
+    return list(diffs.values())
+
+
+def _write_cells(cells: Sequence[gf.Component], path: pathlib.Path) -> None:
+    # writes the cells and their sub-cells only, not the whole layout
+    options = gf.kdb.SaveLayoutOptions()
+    options.clear_cells()
+    for c in cells:
+        options.add_cell(c.cell_index())
+    gf.kcl.layout.write(str(path), options)
+
+
+def _fingerprints(layout: gf.kdb.Layout, cell: gf.kdb.Cell) -> dict[str, str]:
+    # per layer, hash of the cell shapes and of the fingerprints and placements of its sub-cells, bottom-up
+    layers = {
+        li: f"{layout.get_info(li).layer}/{layout.get_info(li).datatype}"
+        for li in layout.layer_indexes()
+    }
+    called = set(cell.called_cells()) | {cell.cell_index()}
+    memo: dict[int, dict[str, str]] = {}
+    for ci in layout.each_cell_bottom_up():
+        if ci not in called:
+            continue
+        current = layout.cell(ci)
+        content: dict[str, list[str]] = {}
+        for li, name in layers.items():
+            shapes = current.shapes(li)
+            if not shapes.is_empty():
+                content.setdefault(name, []).extend(s.to_s() for s in shapes.each())
+        for inst in current.each_inst():
+            placement = f"{inst.cplx_trans} {inst.a} {inst.b} {inst.na} {inst.nb}"
+            for name, h in memo[inst.cell_index].items():
+                content.setdefault(name, []).append(f"{h} {placement}")
+        memo[ci] = {
+            name: hashlib.sha256("\n".join(sorted(lines)).encode()).hexdigest()
+            for name, lines in content.items()
+        }
+    return memo[cell.cell_index()]
+
+
+def _load(path: str) -> gf.kdb.Layout:
+    if path not in _LAYOUTS:
+        layout = gf.kdb.Layout()
+        layout.read(path)
+        _LAYOUTS[path] = layout
+    return _LAYOUTS[path]
+
+
+def _region(
+    path: str,
+    name: str,
+    layer: tuple[int, int],
+    box: gf.kdb.Box,
+) -> gf.kdb.Region:
+    # flattened shapes clipped to the box, only cells overlapping it are visited
+    layout = _load(path)
+    li = layout.find_layer(layer[0], layer[1])
+    if li is None:
+        return gf.kdb.Region()
+    shapes = layout.cell(name).begin_shapes_rec_overlapping(li, box)
+    return gf.kdb.Region(shapes) & gf.kdb.Region(box)
+
+
+def _bbox(path: str, name: str, layer: tuple[int, int]) -> gf.kdb.Box:
+    layout = _load(path)
+    li = layout.find_layer(layer[0], layer[1])
+    return gf.kdb.Box() if li is None else layout.cell(name).bbox(li)
+
+
+def _xor_tile(
+    current: tuple[str, str],
+    golden: tuple[str, str],
+    box: tuple[int, int, int, int],
+    layer: tuple[int, int],
+) -> tuple[int, list[tuple[int, int, int, int]]]:
+    # XOR of one tile of one layer, area and bounding boxes of the differences (unit: database units)
+    tile = gf.kdb.Box(*box)
+    xor = _region(*current, layer, tile) ^ _region(*golden, layer, tile)
+    return xor.area(), [
+        (p.bbox().left, p.bbox().bottom, p.bbox().right, p.bbox().top)
+        for p in xor.each_merged()
+    ]
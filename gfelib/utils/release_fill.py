@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import numpy as np
+
+import gfelib as gl
+
+
+def release_fill(
+    component: gf.Component,
+    geometry_layer: gf.typings.LayerSpec,
+    release_spec: gl.datatypes.ReleaseSpec,
+    patch_rounds: int = 4,
+) -> None:
+    """Inserts release holes into every polygon of `geometry_layer`, including references, for shapes without an analytic lattice
+
+    Polygons are merged, then filled with a square lattice at `release_pitch`, centered on their bounding box.
+    Hole centers keep half a pitch from the polygon edges, same as the `rectangle` lattice, and one pitch from holes already on `release_spec.layer`,
+    so partially released components only get holes where they lack them.
+    The lattice phase leaves gaps along some edges, the islands found by `unreleased_islands` are then covered by extra holes along their outline and over their interior,
+    for up to `patch_rounds` rounds.
+
+    Args:
+        component: component to insert the holes into, must not be locked
+        geometry_layer: polygon layer to release
+        release_spec: release specifications
+        patch_rounds: maximum number of gap patching rounds, `0` for the lattice only
+    """
+    if not release_spec.released:
+        return
+
+    dbu = component.kcl.dbu
+    # `release_pitch` with the inscribed radius of the hole polygon, so polygonal holes still touch at the lattice cell centers
+    inscribed = min(
+        abs(e.distance(gf.kdb.DPoint(0, 0)))
+        for e in release_spec.hole_polygon.each_edge()
+    )
+    pitch = np.sqrt(2) * (inscribed + release_spec.distance) - dbu
+    cell = component.kdb_cell
+
+    geometry = gf.kdb.Region(cell.begin_shapes_rec(gf.get_layer(geometry_layer)))
+    allowed = geometry.sized(-round(0.5 * pitch / dbu))
+    if allowed.is_empty():
+        return
+
+    holes = gf.kdb.Region(cell.begin_shapes_rec(gf.get_layer(release_spec.layer)))
+    if not holes.is_empty():
+        allowed -= holes.sized(round((pitch - release_spec.hole_radius) / dbu))
+
+    gl.utils.place_holes(
+        component=component,
+        hole=release_spec.hole,
+        points=gl.utils.polygon_lattice(
+            region=allowed,
+            pitch=pitch,
+            dbu=dbu,
+        ),
+    )
+
+    # patch holes must fit inside the polygons
+    fits = geometry.sized(-round(release_spec.hole_radius / dbu))
+    for _ in range(patch_rounds):
+        islands = gl.utils.unreleased_islands(
+            component=component,
+            geometry_layer=geometry_layer,
+            release_spec=release_spec,
+        )
+        # clipped to where a hole fits, any point inside the clipped islands is valid
+        islands = gf.kdb.Region([island.to_itype(dbu) for island in islands]) & fits
+        points = _cover(
+            islands=islands,
+            pitch=pitch / dbu,
+            reach=(release_spec.hole_radius + release_spec.distance) / dbu,
+        )
+        if len(points) == 0:
+            return
+        gl.utils.place_holes(
+            component=component,
+            hole=release_spec.hole,
+            points=points * dbu,
+        )
+
+
+def _cover(islands: gf.kdb.Region, pitch: float, reach: float) -> np.ndarray:
+    # greedy cover of the island outlines, then of their interior lattice (unit: database units)
+    # a candidate is kept if no kept hole releases it, kept holes are farther than `reach` apart and never overlap
+    candidates = np.concatenate(
+        (
+            gl.utils.boundary_lattice(
+                region=islands,
+                pitch=max(int(reach // 2), 1),
+                dbu=1,
+            ),
+            gl.utils.polygon_lattice(region=islands, pitch=pitch, dbu=1),
+        )
+    )
+    kept = []
+    grid: dict[tuple[int, int], list[np.ndarray]] = {}
+    for p in candidates:
+        i, j = (p // reach).astype(int)
+        if any(
+            np.hypot(*(p - q)) <= reach
+            for di in (-1, 0, 1)
+            for dj in (-1, 0, 1)
+            for q in grid.get((i + di, j + dj), ())
+        ):
+            continue
+        kept.append(p)
+        grid.setdefault((i, j), []).append(p)
+    return np.round(np.array(kept, dtype=float).reshape(-1, 2))
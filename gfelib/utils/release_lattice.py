@@ -0,0 +1,390 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import numpy as np
+
+import gfelib as gl
+
+
+def release_pitch(release_spec: gl.datatypes.ReleaseSpec) -> float:
+    """Returns the largest release hole pitch that fully releases a square lattice
+
+    Args:
+        release_spec: release specifications
+    """
+    return 2 * (release_spec.hole_radius + release_spec.distance) / np.sqrt(2)
+
+
+def grid_pitch(
+    size: gf.typings.Size,
+    pitch: float,
+) -> tuple[float, float]:
+    """Returns the x and y hole pitch of a rectangular lattice
+
+    Args:
+        size: rectangle width and height
+        pitch: maximum hole pitch
+    """
+    return size[0] / np.ceil(size[0] / pitch), size[1] / np.ceil(size[1] / pitch)
+
+
+def grid_axes(
+    size: gf.typings.Size,
+    pitch: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the x and y hole center axes of a rectangular lattice, south-west of the rectangle is (0, 0)
+
+    Args:
+        size: rectangle width and height
+        pitch: maximum hole pitch
+    """
+    sx, sy = grid_pitch(size, pitch)
+    return np.arange(0.5 * sx, size[0], sx), np.arange(0.5 * sy, size[1], sy)
+
+
+def grid_lattice(
+    size: gf.typings.Size,
+    pitch: float,
+    centered: bool,
+) -> np.ndarray:
+    """Returns the hole centers of a rectangular lattice as an (N, 2) array
+
+    Args:
+        size: rectangle width and height
+        pitch: maximum hole pitch
+        centered: `True` sets center to (0, 0), `False` sets south-west to (0, 0)
+    """
+    xs, ys = grid_axes(size, pitch)
+    if centered:
+        xs = xs - 0.5 * size[0]
+        ys = ys - 0.5 * size[1]
+    x, y = np.meshgrid(xs, ys)
+    return np.stack((x.ravel(), y.ravel()), axis=-1)
+
+
+def polar_lattice(
+    radii: np.ndarray,
+    span: float,
+    pitch: float,
+) -> np.ndarray:
+    """Returns the hole centers of concentric arcs as an (N, 2) array, arcs start at 0 degrees
+
+    Args:
+        radii: arc radii
+        span: arc angular span (unit: degrees)
+        pitch: maximum hole pitch
+    """
+    radii = np.asarray(radii, dtype=float)
+    span_rad = span * np.pi / 180
+
+    steps = span_rad * radii // pitch + 1
+    dt = span_rad / steps
+
+    # flatten all arcs into one index space, `k` is the hole index along its own arc
+    counts = steps.astype(int)
+    arc = np.repeat(np.arange(len(radii)), counts)
+    k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+
+    r = radii[arc]
+    t = dt[arc] * (k + 0.5)
+    return np.stack((r * np.cos(t), r * np.sin(t)), axis=-1)
+
+
+def circle_lattice(
+    radius: float,
+    pitch: float,
+) -> np.ndarray:
+    """Returns the hole centers of a circular lattice as an (N, 2) array
+
+    Args:
+        radius: circle radius
+        pitch: maximum hole pitch
+    """
+    sr = radius / (radius // pitch + 1.5)
+    return polar_lattice(
+        radii=np.arange(0, radius, sr),
+        span=360,
+        pitch=pitch,
+    )
+
+
+def ring_lattice(
+    radius_inner: float,
+    radius_outer: float,
+    span: float,
+    pitch: float,
+) -> np.ndarray:
+    """Returns the hole centers of an annular sector lattice as an (N, 2) array, sector starts at 0 degrees
+
+    Args:
+        radius_inner: ring inner radius
+        radius_outer: ring outer radius
+        span: ring angular span (unit: degrees)
+        pitch: maximum hole pitch
+    """
+    width = radius_outer - radius_inner
+    sr = width / (width // pitch + 1)
+    return polar_lattice(
+        radii=np.arange(radius_inner + 0.5 * sr, radius_outer, sr),
+        span=span,
+        pitch=pitch,
+    )
+
+
+def polygon_lattice(
+    region: gf.kdb.Region,
+    pitch: float,
+    dbu: float,
+) -> np.ndarray:
+    """Returns the points of a square lattice inside polygons as an (N, 2) array, the lattice is centered on the bounding box of `region`
+
+    Args:
+        region: polygons (unit: database units)
+        pitch: lattice pitch
+        dbu: database unit
+    """
+    region = region.merged()
+    if region.is_empty():
+        return np.empty((0, 2))
+
+    box = region.bbox()
+    step = pitch / dbu
+    center = box.center()
+    kx = int(np.ceil(0.5 * box.width() / step))
+    ky = int(np.ceil(0.5 * box.height() / step))
+    xs = center.x + step * np.arange(-kx, kx + 1)
+    ys = center.y + step * np.arange(-ky, ky + 1)
+
+    # scanline even-odd test, every lattice row is crossed by the polygon edges at once
+    edges = np.array(
+        [(e.p1.x, e.p1.y, e.p2.x, e.p2.y) for e in region.edges().each()],
+        dtype=float,
+    ).reshape(-1, 4)
+    y_min = np.minimum(edges[:, 1], edges[:, 3])
+    y_max = np.maximum(edges[:, 1], edges[:, 3])
+    first = np.searchsorted(ys, y_min, side="left")
+    counts = np.searchsorted(ys, y_max, side="left") - first
+    edge = np.repeat(np.arange(len(edges)), counts)
+    row = np.repeat(first, counts) + (
+        np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    )
+    x1, y1, x2, y2 = edges[edge].T
+    crossings = x1 + (ys[row] - y1) * (x2 - x1) / (y2 - y1)
+
+    # sort crossings by row, then by x, and count the crossings left of every point
+    width = box.width() + 2 * step + 1
+    keys = np.sort(row * width + (crossings - box.left + step))
+    point_row, point_col = np.divmod(np.arange(len(xs) * len(ys)), len(xs))
+    point_keys = point_row * width + (xs[point_col] - box.left + step)
+    left = np.searchsorted(keys, point_keys, side="right") - np.searchsorted(
+        keys, point_row * width, side="left"
+    )
+    inside = left % 2 == 1
+
+    return np.stack((xs[point_col[inside]], ys[point_row[inside]]), axis=-1) * dbu
+
+
+def boundary_lattice(
+    region: gf.kdb.Region,
+    pitch: float,
+    dbu: float,
+) -> np.ndarray:
+    """Returns the vertices of polygons and points every `pitch` or less along their edges as an (N, 2) array
+
+    Args:
+        region: polygons (unit: database units)
+        pitch: maximum point spacing along an edge (unit: database units)
+        dbu: database unit
+    """
+    edges = np.array(
+        [(e.p1.x, e.p1.y, e.p2.x, e.p2.y) for e in region.edges().each()],
+        dtype=float,
+    ).reshape(-1, 4)
+    counts = np.maximum(
+        np.ceil(np.hypot(edges[:, 2] - edges[:, 0], edges[:, 3] - edges[:, 1]) / pitch),
+        1,
+    ).astype(int)
+
+    # same flattening as `polar_lattice`, `k` is the point index along its own edge
+    edge = np.repeat(np.arange(len(edges)), counts)
+    k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    t = k / counts[edge]
+    p1 = edges[edge, :2]
+    p2 = edges[edge, 2:]
+    return (p1 + (p2 - p1) * t[:, None]) * dbu
+
+
+def rotated_lattice(
+    points: np.ndarray,
+    angle: float,
+    dbu: float,
+) -> np.ndarray:
+    """Returns hole centers snapped to the database grid, then rotated about (0, 0), same as `ref.move(...).rotate(...)`
+
+    Args:
+        points: (N, 2) array of hole centers before rotation
+        angle: rotation of the whole lattice about (0, 0) (unit: degrees)
+        dbu: database unit
+    """
+    points = gl.utils.snap_dbu(points, dbu).reshape(-1, 2) * dbu
+    t = angle * np.pi / 180
+    x = points[:, 0] * np.cos(t) - points[:, 1] * np.sin(t)
+    y = points[:, 0] * np.sin(t) + points[:, 1] * np.cos(t)
+    return np.stack((x, y), axis=-1)
+
+
+def place_holes(
+    component: gf.Component,
+    hole: gf.Component,
+    points: np.ndarray,
+    angle: float = 0,
+) -> None:
+    """Inserts a hole reference at every point, rotated about (0, 0), evenly spaced holes are merged into array references by `place_instances`
+
+    Args:
+        component: component to insert the holes into
+        hole: release hole component
+        points: (N, 2) array of hole centers before rotation
+        angle: rotation of the whole lattice about (0, 0) (unit: degrees)
+    """
+    gl.utils.place_instances(
+        component=component,
+        cell=hole,
+        points=rotated_lattice(
+            points=points,
+            angle=angle,
+            dbu=component.kcl.dbu,
+        ),
+        angle=angle,
+    )
+
+
+def place_hole_array(
+    component: gf.Component,
+    hole: gf.Component,
+    size: gf.typings.Size,
+    pitch: float,
+    centered: bool,
+) -> None:
+    """Inserts a rectangular hole lattice as array references, holes keep their exact `grid_lattice` positions
+
+    A pitch on the database grid gives a single array reference, otherwise `place_instances` splits the lattice into a few interleaved arrays.
+
+    Args:
+        component: component to insert the holes into
+        hole: release hole component
+        size: rectangle width and height
+        pitch: maximum hole pitch
+        centered: `True` sets center to (0, 0), `False` sets south-west to (0, 0)
+    """
+    gl.utils.place_instances(
+        component=component,
+        cell=hole,
+        points=grid_lattice(
+            size=size,
+            pitch=pitch,
+            centered=centered,
+        ),
+    )
+
+
+def place_hole_tiles(
+    component: gf.Component,
+    hole: gf.Component,
+    size: gf.typings.Size,
+    pitch: float,
+    centered: bool,
+) -> None:
+    """Inserts a rectangular hole lattice as a hierarchy of tiles, with a single reference in `component`
+
+    A row is built from dyadic blocks of holes (1, 2, 4, ... holes), and the field from dyadic blocks of rows.
+    Blocks with equal hole offsets share one cell, named after its content, so equal blocks are also shared across components.
+    Holes land exactly where `place_holes` puts the `grid_lattice` holes.
+
+    Args:
+        component: component to insert the holes into
+        hole: release hole component
+        size: rectangle width and height
+        pitch: maximum hole pitch
+        centered: `True` sets center to (0, 0), `False` sets south-west to (0, 0)
+    """
+    xs, ys = grid_axes(size, pitch)
+    if len(xs) == 0 or len(ys) == 0:
+        return
+    if centered:
+        xs = xs - 0.5 * size[0]
+        ys = ys - 0.5 * size[1]
+
+    # snap to the database grid, same as `place_holes`
+    x, y = (gl.utils.snap_dbu(a, component.kcl.dbu) for a in (xs, ys))
+
+    row = _tile(
+        leaf=hole,
+        offsets=tuple((x - x[0]).tolist()),
+        axis=0,
+    )
+    field = _tile(
+        leaf=row,
+        offsets=tuple((y - y[0]).tolist()),
+        axis=1,
+    )
+    gl.utils.place_instances(
+        component=component,
+        cell=field,
+        points=np.array([(x[0], y[0])]) * component.kcl.dbu,
+    )
+
+
+def _tile(
+    leaf: gf.Component,
+    offsets: tuple[int, ...],
+    axis: int,
+) -> gf.Component:
+    # `leaf` at every offset (unit: database units) along `axis`
+    if len(offsets) == 1:
+        return leaf
+    return hole_tile(leaf=leaf, offsets=offsets, axis=axis)
+
+
+@gl.utils.default_cell
+def hole_tile(
+    leaf: gf.Component,
+    offsets: tuple[int, ...],
+    axis: int,
+) -> gf.Component:
+    """Returns `leaf` at every offset along one axis as two sub-tiles, the tiles of `place_hole_tiles`
+
+    Args:
+        leaf: hole or tile component
+        offsets: leaf offsets along the axis (unit: database units)
+        axis: 0 for x, 1 for y
+    """
+    c = gf.Component()
+
+    # split off the largest power of two, so equal blocks line up along the whole row
+    half = 1 << ((len(offsets) - 1).bit_length() - 1)
+    first = _tile(
+        leaf=leaf,
+        offsets=offsets[:half],
+        axis=axis,
+    )
+    second = _tile(
+        leaf=leaf,
+        offsets=tuple(o - offsets[half] for o in offsets[half:]),
+        axis=axis,
+    )
+
+    d = np.zeros(2)
+    d[axis] = offsets[half] * c.kcl.dbu
+    gl.utils.place_instances(
+        component=c,
+        cell=first,
+        points=np.zeros((1, 2)),
+    )
+    gl.utils.place_instances(
+        component=c,
+        cell=second,
+        points=d,
+    )
+    return c
@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import numpy as np
+import mmap
+import os
+import pathlib
+import struct
+import tempfile
+from types import TracebackType
+
+import gfelib as gl
+
+# GDSII record types
+_HEADER = 0x00
+_BGNLIB = 0x01
+_LIBNAME = 0x02
+_UNITS = 0x03
+_ENDLIB = 0x04
+_BGNSTR = 0x05
+_STRNAME = 0x06
+_ENDSTR = 0x07
+_SREF = 0x0A
+_XY = 0x10
+_ENDEL = 0x11
+_SNAME = 0x12
+_STRANS = 0x1A
+_ANGLE = 0x1C
+
+# GDSII data types
+_NONE = 0
+_BITS = 1
+_INT16 = 2
+_INT32 = 3
+_REAL8 = 5
+_ASCII = 6
+
+
+class StreamWriter:
+    """Writes a GDSII top cell one device at a time, releasing every device from the layout once written
+
+    Each `add` writes the device hierarchy to the output file and deletes it from `gf.kcl`, only the placements of the top cell are kept until `close`.
+    Peak memory therefore depends on the largest device, not the whole layout.
+    Cells shared by several devices, e.g. release holes, are written once and rebuilt on demand.
+    Release holes given as a `HoleLayout` never enter the layout, `add_holes` writes them from their center arrays.
+
+    ```python
+    with gl.utils.StreamWriter("reticle.gds", top_name="reticle") as w:
+        w.add(gl.device.chip_border(...))
+        for x, y in positions:
+            w.add(gl.flexure.butterfly(...), origin=(x, y))
+    ```
+
+    Args:
+        path: output GDSII file, written to `<path>.partial` and moved in place by `close`
+        top_name: top cell name
+    """
+
+    def __init__(
+        self,
+        path: str | pathlib.Path,
+        top_name: str,
+    ) -> None:
+        self.path = pathlib.Path(path)
+        if self.path.suffix.lower() != ".gds":
+            raise ValueError(f"StreamWriter only writes GDSII files, got {self.path}")
+        self.top_name = top_name
+        self.placements: list[tuple[str, gf.kdb.DCplxTrans]] = []
+        self.holes: list[tuple[str, gl.utils.HoleLayout, gf.kdb.DCplxTrans]] = []
+        self._written: set[str] = set()
+        self._dbu = gf.kcl.dbu
+
+        self._partial = self.path.with_name(f"{self.path.name}.partial")
+        self._file = open(self._partial, "wb")
+        self._file.write(_record(_HEADER, _INT16, struct.pack(">h", 600)))
+        self._file.write(_record(_BGNLIB, _INT16, bytes(24)))
+        self._file.write(_record(_LIBNAME, _ASCII, _ascii(top_name)))
+        self._file.write(
+            _record(
+                _UNITS,
+                _REAL8,
+                _real8(self._dbu) + _real8(self._dbu * 1e-6),
+            )
+        )
+
+    def add(
+        self,
+        component: gf.Component,
+        origin: tuple[float, float] = (0, 0),
+        rotation: float = 0,
+        mirror: bool = False,
+    ) -> str:
+        """Writes a device, places it in the top cell and releases it, returns the device cell name
+
+        The component must not be used after this call, place further copies with `place`.
+
+        Args:
+            component: device to write
+            origin: placement origin
+            rotation: placement rotation (unit: degrees)
+            mirror: `True` to mirror about the x-axis before rotating
+        """
+        name = component.name
+        if name == self.top_name:
+            raise ValueError(f"device name {name!r} collides with the top cell")
+        if name not in self._written:
+            self._write_hierarchy(component)
+        self._release(component)
+        self.place(
+            name=name,
+            origin=origin,
+            rotation=rotation,
+            mirror=mirror,
+        )
+        return name
+
+    def place(
+        self,
+        name: str,
+        origin: tuple[float, float] = (0, 0),
+        rotation: float = 0,
+        mirror: bool = False,
+    ) -> None:
+        """Places another copy of a device that was written by `add`
+
+        Args:
+            name: device cell name returned by `add`
+            origin: placement origin
+            rotation: placement rotation (unit: degrees)
+            mirror: `True` to mirror about the x-axis before rotating
+        """
+        if name not in self._written:
+            raise KeyError(f"cell {name!r} has not been written")
+        self.placements.append(
+            (name, gf.kdb.DCplxTrans(1, rotation, mirror, origin[0], origin[1]))
+        )
+
+    def add_holes(
+        self,
+        holes: gl.utils.HoleLayout,
+        origin: tuple[float, float] = (0, 0),
+        rotation: float = 0,
+        mirror: bool = False,
+    ) -> None:
+        """Places release holes in the top cell, written by `close` as one reference per hole
+
+        Args:
+            holes: release holes
+            origin: placement origin
+            rotation: placement rotation (unit: degrees)
+            mirror: `True` to mirror about the x-axis before rotating
+        """
+        if holes.dbu != self._dbu:
+            raise ValueError("Hole layout database unit differs from the output file")
+        name = holes.spec.hole.name
+        if name == self.top_name:
+            raise ValueError(f"hole name {name!r} collides with the top cell")
+        if name not in self._written:
+            self._write_hierarchy(holes.spec.hole)
+        self.holes.append(
+            (name, holes, gf.kdb.DCplxTrans(1, rotation, mirror, origin[0], origin[1]))
+        )
+
+    def close(self) -> None:
+        """Writes the top cell and finalizes the output file"""
+        if self._file.closed:
+            return
+        f = self._file
+        f.write(_record(_BGNSTR, _INT16, bytes(24)))
+        f.write(_record(_STRNAME, _ASCII, _ascii(self.top_name)))
+        for name, trans in self.placements:
+            f.write(_record(_SREF, _NONE, b""))
+            f.write(_record(_SNAME, _ASCII, _ascii(name)))
+            if trans.is_mirror() or trans.angle != 0:
+                f.write(
+                    _record(
+                        _STRANS,
+                        _BITS,
+                        struct.pack(">H", 0x8000 if trans.is_mirror() else 0),
+                    )
+                )
+                if trans.angle != 0:
+                    f.write(_record(_ANGLE, _REAL8, _real8(trans.angle)))
+            disp = trans.disp.to_itype(self._dbu)
+            f.write(_record(_XY, _INT32, struct.pack(">ii", disp.x, disp.y)))
+            f.write(_record(_ENDEL, _NONE, b""))
+        for name, holes, trans in self.holes:
+            self._write_holes(name, holes, trans)
+        f.write(_record(_ENDSTR, _NONE, b""))
+        f.write(_record(_ENDLIB, _NONE, b""))
+        f.close()
+        os.replace(self._partial, self.path)
+
+    def abort(self) -> None:
+        """Discards the output file"""
+        if not self._file.closed:
+            self._file.close()
+        self._partial.unlink(missing_ok=True)
+
+    def __enter__(self) -> StreamWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _write_hierarchy(self, component: gf.Component) -> None:
+        layout = component.kcl.layout
+        options = gf.kdb.SaveLayoutOptions()
+        options.format = "GDS2"
+        options.write_context_info = False
+        options.clear_cells()
+        options.add_cell(component.cell_index())
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp = pathlib.Path(tmpdir) / "cell.gds"
+            layout.write(str(tmp), options)
+            with (
+                open(tmp, "rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data,
+            ):
+                # copy structures not written yet, the header and ENDLIB are written by this class
+                i = 0
+                start = None
+                skip = False
+                while i < len(data):
+                    size, kind = struct.unpack_from(">HB", data, i)
+                    if kind == _BGNSTR:
+                        start = i
+                    elif kind == _STRNAME:
+                        name = _unascii(data[i + 4 : i + size])
+                        skip = name in self._written
+                        self._written.add(name)
+                    elif kind == _ENDSTR:
+                        if not skip:
+                            self._file.write(data[start : i + size])
+                        start = None
+                    elif kind == _ENDLIB:
+                        break
+                    i += size
+
+    def _write_holes(
+        self,
+        name: str,
+        holes: gl.utils.HoleLayout,
+        trans: gf.kdb.DCplxTrans,
+    ) -> None:
+        # one SREF record group per hole, identical except for XY, packed as a structured array
+        t = trans.angle * np.pi / 180
+        sign = -1 if trans.is_mirror() else 1
+        for angle, points in holes.each_group():
+            angle = (trans.angle + sign * angle) % 360
+            head = _record(_SREF, _NONE, b"") + _record(_SNAME, _ASCII, _ascii(name))
+            if trans.is_mirror() or angle != 0:
+                head += _record(
+                    _STRANS,
+                    _BITS,
+                    struct.pack(">H", 0x8000 if trans.is_mirror() else 0),
+                )
+                if angle != 0:
+                    head += _record(_ANGLE, _REAL8, _real8(angle))
+            head += struct.pack(">HBB", 12, _XY, _INT32)
+
+            x = points[:, 0]
+            y = sign * points[:, 1]
+            xt = x * np.cos(t) - y * np.sin(t) + trans.disp.x
+            yt = x * np.sin(t) + y * np.cos(t) + trans.disp.y
+            xy = gl.utils.snap_dbu(np.stack((xt, yt), axis=-1), self._dbu)
+
+            records = np.empty(
+                len(xy),
+                dtype=[
+                    ("head", f"V{len(head)}"),
+                    ("xy", ">i4", (2,)),
+                    ("endel", "V4"),
+                ],
+            )
+            records["head"] = np.void(head)
+            records["xy"] = xy
+            records["endel"] = np.void(_record(_ENDEL, _NONE, b""))
+            self._file.write(records.tobytes())
+
+    def _release(self, component: gf.Component) -> None:
+        # delete the device and every cell only used by it, the cell caches rebuild them on demand
+        layout = component.kcl.layout
+        top = component.cell_index()
+        called = set(component.kdb_cell.called_cells())
+        release = {top}
+        for ci in layout.each_cell_top_down():
+            if ci in called and all(
+                p in release for p in layout.cell(ci).each_parent_cell()
+            ):
+                release.add(ci)
+        component.kcl.delete_cells(sorted(release))
+
+
+def _record(kind: int, data_type: int, data: bytes) -> bytes:
+    return struct.pack(">HBB", 4 + len(data), kind, data_type) + data
+
+
+def _ascii(text: str) -> bytes:
+    data = text.encode("ascii")
+    return data + b"\0" if len(data) % 2 else data
+
+
+def _unascii(data: bytes) -> str:
+    return bytes(data).rstrip(b"\0").decode("ascii")
+
+
+def _real8(value: float) -> bytes:
+    # GDSII 8-byte real: sign bit, base-16 excess-64 exponent, 56-bit mantissa
+    if value == 0:
+        return bytes(8)
+    sign = 0x80 if value < 0 else 0
+    value = abs(value)
+    exponent = 64
+    while value >= 1:
+        value /= 16
+        exponent += 1
+    while value < 1 / 16:
+        value *= 16
+        exponent -= 1
+    mantissa = round(value * 2**56)
+    if mantissa >= 2**56:
+        mantissa //= 16
+        exponent += 1
+    return bytes([sign | exponent]) + mantissa.to_bytes(7, "big")
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import concurrent.futures
+import itertools
+import os
+import pathlib
+import tempfile
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+import gfelib as gl
+from gfelib.utils.default_cell import _read_cells
+
+
+def sweep_grid(axes: Mapping[str, Sequence[Any]]) -> list[dict[str, Any]]:
+    """Returns the cartesian product of parameter axes as a list of parameter dicts
+
+    Args:
+        axes: parameter name to values, use a single value for fixed parameters
+    """
+    keys = list(axes)
+    return [
+        dict(zip(keys, values))
+        for values in itertools.product(*(axes[k] for k in keys))
+    ]
+
+
+def sweep(
+    func: Callable[..., gf.Component],
+    params: Sequence[Mapping[str, Any]] | Mapping[str, Sequence[Any]],
+    spacing: float,
+    columns: int | None,
+    label_layer: gf.typings.LayerSpec | None,
+    max_workers: int | None = None,
+    initializer: Callable[[], None] | None = None,
+) -> gf.Component:
+    """Returns a labelled, tiled layout of cell variants built across a process pool
+
+    Variants are built in worker processes and loaded back by cell name, so the layout does not depend on `max_workers`.
+
+    Args:
+        func: gfelib cell function, must be importable by the worker processes
+        params: list of parameter dicts, or parameter axes to sweep as a grid (see `sweep_grid`)
+        spacing: clearance between neighbouring variants
+        columns: number of tile columns, `None` for a square layout
+        label_layer: variant label layer, `None` for no labels
+        max_workers: number of worker processes, `None` for one per core, `1` to build in this process
+        initializer: called once in every worker process before building, e.g. to activate the PDK
+    """
+    if isinstance(params, Mapping):
+        params = sweep_grid(params)
+    params = [dict(p) for p in params]
+
+    if max_workers != 1 and len(params) > 1:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=initializer,
+            ) as executor:
+                paths = executor.map(
+                    _sweep_build,
+                    itertools.repeat(func),
+                    params,
+                    itertools.repeat(tmpdir),
+                )
+                # the layout cache of `gf.cell` picks up the loaded variants by name
+                for path in paths:
+                    _read_cells(path)
+
+    return gl.device.sweep_layout(
+        func=func,
+        params=params,
+        spacing=spacing,
+        columns=columns,
+        label_layer=label_layer,
+    )
+
+
+def _sweep_build(
+    func: Callable[..., gf.Component],
+    params: dict[str, Any],
+    tmpdir: str,
+) -> pathlib.Path:
+    c = func(**params)
+    path = pathlib.Path(tmpdir) / f"{os.getpid()}_{c.name}.gds"
+    c.write_gds(gdspath=path)
+    return path
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import numpy as np
+from scipy import spatial
+
+import gfelib as gl
+
+
+def unreleased_islands(
+    component: gf.Component,
+    geometry_layer: gf.typings.LayerSpec,
+    release_spec: gl.datatypes.ReleaseSpec,
+) -> list[gf.kdb.DPolygon]:
+    """Returns the parts of `geometry_layer` farther than `release_spec.distance` from every release hole and polygon edge, as polygons in um
+
+    Candidate points are screened in bulk with a KD-tree of hole centers: Delaunay circumcenters of the hole centers (the local maxima of the distance to the nearest hole),
+    plus the vertices of, and samples along, the geometry eroded by `distance`.
+    Exact islands are then computed with polygon booleans only around flagged points, so a fully released die costs a single pass over its holes.
+
+    Args:
+        component: component to verify, including all references
+        geometry_layer: released polygon layer
+        release_spec: release specifications, holes are read from `release_spec.layer`
+    """
+    layout = component.kcl.layout
+    cell = component.kdb_cell
+    dbu = layout.dbu
+    hole_index = gf.get_layer(release_spec.layer)
+    distance = round(release_spec.distance / dbu)
+    spacing = max(distance // 2, 1)
+
+    # points farther than `distance` from the polygon edges, only holes can release them
+    core = gf.kdb.Region(cell.begin_shapes_rec(gf.get_layer(geometry_layer)))
+    core = core.sized(-distance)
+    if core.is_empty():
+        return []
+
+    centers, radii = _hole_circles(cell, hole_index)
+    if len(centers) == 0:
+        return [p.to_dtype(dbu) for p in core.merged().each()]
+
+    boundary = gl.utils.boundary_lattice(region=core, pitch=spacing, dbu=1)
+    circumcenters = _circumcenters(centers)
+    samples = np.concatenate((boundary, circumcenters))
+    tree = spatial.cKDTree(centers)
+    k = min(8, len(centers))
+    dist, idx = tree.query(samples, k=k)
+    clearance = np.min(
+        dist.reshape(len(samples), k) - radii[idx].reshape(len(samples), k),
+        axis=1,
+    )
+    # boundary samples miss at most half a spacing between neighbours,
+    # circumcenters are exact maxima, the lattices touch there by design so only rounding is tolerated
+    threshold = np.concatenate(
+        (
+            np.full(len(boundary), distance - 0.5 * spacing),
+            np.full(len(circumcenters), distance + 0.5),
+        )
+    )
+    limit = core.bbox()
+    flagged = samples[
+        (clearance > threshold)
+        & np.all(samples >= (limit.left, limit.bottom), axis=1)
+        & np.all(samples <= (limit.right, limit.top), axis=1)
+    ]
+    if len(flagged) == 0:
+        return []
+
+    # exact islands on a grid of tiles around the flagged points
+    tile = int(np.ceil(2 * (radii.max() + distance)))
+    keys = np.floor_divide(np.round(flagged).astype(np.int64), tile)
+    tiles = {
+        (i + di, j + dj)
+        for i, j in set(map(tuple, keys.tolist()))
+        for di in (-1, 0, 1)
+        for dj in (-1, 0, 1)
+    }
+    islands = _islands_in_tiles(
+        cell=cell,
+        hole_index=hole_index,
+        core=core,
+        tiles=tiles,
+        tile=tile,
+        distance=distance,
+    )
+    return [p.to_dtype(dbu) for p in islands.each()]
+
+
+def _hole_circles(cell: gf.kdb.Cell, hole_index: int) -> tuple[np.ndarray, np.ndarray]:
+    # hole centers and inscribed radii, from the untransformed bounding box of every hole (unit: database units)
+    circles = []
+    it = cell.begin_shapes_rec(hole_index)
+    while not it.at_end():
+        b = it.shape().bbox()
+        t = it.trans()
+        center = t * b.center()
+        circles.append((center.x, center.y, 0.5 * t.mag * min(b.width(), b.height())))
+        it.next()
+    circles = np.array(circles, dtype=float).reshape(-1, 3)
+    return circles[:, :2], circles[:, 2]
+
+
+def _circumcenters(points: np.ndarray) -> np.ndarray:
+    if len(points) < 3:
+        return np.empty((0, 2))
+    try:
+        simplices = spatial.Delaunay(points).simplices
+    except spatial.QhullError:
+        # all centers collinear, the boundary samples cover this case
+        return np.empty((0, 2))
+
+    a, b, c = (points[simplices[:, i]] for i in range(3))
+    b = b - a
+    c = c - a
+    d = 2 * (b[:, 0] * c[:, 1] - b[:, 1] * c[:, 0])
+    valid = d != 0
+    b, c, d, a = b[valid], c[valid], d[valid], a[valid]
+    bb = np.sum(b * b, axis=1)
+    cc = np.sum(c * c, axis=1)
+    x = (c[:, 1] * bb - b[:, 1] * cc) / d
+    y = (b[:, 0] * cc - c[:, 0] * bb) / d
+    return a + np.stack((x, y), axis=-1)
+
+
+def _islands_in_tiles(
+    cell: gf.kdb.Cell,
+    hole_index: int,
+    core: gf.kdb.Region,
+    tiles: set[tuple[int, int]],
+    tile: int,
+    distance: int,
+) -> gf.kdb.Region:
+    # exact islands on the union of square tiles, grown until no island is cut by the tiles outline
+    limit = core.bbox()
+    while True:
+        area = gf.kdb.Region(
+            [
+                gf.kdb.Box(i * tile, j * tile, (i + 1) * tile, (j + 1) * tile)
+                for i, j in tiles
+            ]
+        ).merged()
+
+        it = cell.begin_shapes_rec(hole_index)
+        it.region = area.sized(distance)
+        islands = (core & area) - gf.kdb.Region(it).sized(distance)
+
+        grown = set(tiles)
+        for island in islands.interacting(area.edges()).each():
+            b = island.bbox().enlarged(1, 1) & limit
+            for i in range(b.left // tile - 1, b.right // tile + 2):
+                for j in range(b.bottom // tile - 1, b.top // tile + 2):
+                    grown.add((i, j))
+        if len(grown) == len(tiles):
+            return islands.merged()
+        tiles = grown
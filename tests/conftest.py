@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import pytest
+from collections.abc import Callable
+from typing import Any
+
+import gfelib as gl
+
+
+@pytest.fixture(autouse=True, scope="session")
+def pdk() -> None:
+    gf.gpdk.PDK.activate()
+
+
+@pytest.fixture
+def release_spec_factory() -> Callable[..., gl.datatypes.ReleaseSpec]:
+    """Returns a factory of the release specifications shared by the tests, keyword arguments override fields"""
+
+    def factory(**kwargs: Any) -> gl.datatypes.ReleaseSpec:
+        return gl.datatypes.ReleaseSpec(
+            **{
+                "hole_radius": 2,
+                "distance": 5,
+                "angle_resolution": 10,
+                "layer": (2, 0),
+                **kwargs,
+            }
+        )
+
+    return factory
+
+
+@pytest.fixture
+def release_spec(
+    release_spec_factory: Callable[..., gl.datatypes.ReleaseSpec],
+) -> gl.datatypes.ReleaseSpec:
+    """Returns the release specifications shared by the tests"""
+    return release_spec_factory()
+
+
+@pytest.fixture
+def xor_area() -> Callable[[gf.Component, gf.Component, gf.typings.LayerSpec], int]:
+    """Returns the area of the XOR of two flattened components on one layer (unit: database units^2)"""
+
+    def area(a: gf.Component, b: gf.Component, layer: gf.typings.LayerSpec) -> int:
+        li = gf.get_layer(layer)
+        return (
+            gf.kdb.Region(a.kdb_cell.begin_shapes_rec(li))
+            ^ gf.kdb.Region(b.kdb_cell.begin_shapes_rec(li))
+        ).area()
+
+    return area
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import gfelib as gl
+
+
+def test_chord_error_within_bound() -> None:
+    for radius in (1, 10, 100):
+        angle_resolution = gl.utils.angle_resolution_safe(radius=radius, max_error=0.01)
+        sagitta = radius * (1 - np.cos(angle_resolution * np.pi / 180 / 2))
+        assert sagitta <= 0.01
+        assert (360 / angle_resolution) % 1 == pytest.approx(0, abs=1e-9)
+
+
+def test_non_positive_error_raises() -> None:
+    with pytest.raises(ValueError):
+        gl.utils.angle_resolution_safe(radius=10, max_error=0)
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import importlib.util
+import inspect
+import pathlib
+
+import pytest
+
+import gfelib as gl
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+_spec = importlib.util.spec_from_file_location(
+    "benchmark_components", ROOT / "benchmarks" / "benchmark_components.py"
+)
+benchmark_components = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(benchmark_components)
+
+
+def test_every_component_has_a_case() -> None:
+    components = {
+        name
+        for module in (gl.basic, gl.flexure, gl.actuator, gl.device)
+        for name, value in vars(module).items()
+        if inspect.isfunction(value) and not name.startswith("_")
+    }
+    assert components <= benchmark_components.CASES.keys()
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "ring_sector",
+        "circle_max_points",
+        "circle_max_error",
+        "ring_max_points",
+        "ring_max_error",
+    ],
+)
+def test_small_case(name: str) -> None:
+    result = benchmark_components.measure(name, "small")
+    assert result["polygons"] > 0
+    assert result["gds_size"] > 0
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import gfelib as gl
+
+
+def test_hits_and_misses_per_function() -> None:
+    params = dict(
+        size=(120, 90),
+        width=15,
+        geometry_layer=(1, 0),
+        centered=True,
+        release_spec=None,
+    )
+    with gl.utils.build_stats() as stats:
+        gl.basic.rectangle_ring(**params)
+        gl.basic.rectangle_ring(**params)
+    assert gl.utils.get_build_stats() is None
+
+    ring = stats.cells["rectangle_ring"]
+    assert (ring.calls, ring.misses, ring.hits) == (2, 1, 1)
+    assert ring.references > 0
+    assert 0 <= ring.time_self <= ring.time_cumulative
+
+    # nested cells are recorded under their caller in the folded stacks
+    assert ("rectangle_ring", "rectangle") in stats.stacks
+    assert "rectangle_ring " in stats.folded()
+    assert "rectangle_ring" in stats.table()
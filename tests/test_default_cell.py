@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import pathlib
+
+import gfelib as gl
+
+
+def _circle(**kwargs):
+    return gl.basic.circle(
+        radius=30,
+        geometry_layer=(1, 0),
+        angle_resolution=5,
+        release_spec=None,
+        **kwargs,
+    )
+
+
+def test_default_parameters_not_in_name() -> None:
+    c = _circle()
+    assert "max_error" not in c.settings
+    assert _circle(max_error=None) is c
+    assert _circle(max_error=0.01).settings["max_error"] == 0.01
+
+
+def test_disk_cache_eviction_skips_vanished_files(tmp_path, monkeypatch) -> None:
+    gl.utils.enable_disk_cache(tmp_path, max_size=0)
+    try:
+        (tmp_path / "vanished.gds").write_bytes(b"")
+        stat = pathlib.Path.stat
+
+        def racing_stat(self, *args, **kwargs):
+            # another process evicts the file between listing and stat
+            if self.name == "vanished.gds":
+                self.unlink(missing_ok=True)
+            return stat(self, *args, **kwargs)
+
+        monkeypatch.setattr(pathlib.Path, "stat", racing_stat)
+        _circle(max_error=0.02)
+    finally:
+        gl.utils.disable_disk_cache()
+    assert not list(tmp_path.glob("*.gds"))
+
+
+def test_disk_cache_keeps_cells_already_built(tmp_path) -> None:
+    # cache files also hold sub-cells of the session, e.g. the shared release hole, loading must not add to them
+    spec = gl.datatypes.ReleaseSpec(
+        hole_radius=2, distance=5, angle_resolution=10, layer=(2, 0)
+    )
+    params = dict(
+        size=(130, 70), geometry_layer=(1, 0), centered=True, release_spec=spec
+    )
+    gl.utils.enable_disk_cache(tmp_path)
+    try:
+        c = gl.basic.rectangle(**params)
+        shapes = spec.hole.kdb_cell.shapes(gf.get_layer((2, 0))).size()
+        gl.utils.enable_disk_cache(tmp_path)
+        assert gl.basic.rectangle(**params) is c
+    finally:
+        gl.utils.disable_disk_cache()
+    assert spec.hole.kdb_cell.shapes(gf.get_layer((2, 0))).size() == shapes
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import gfelib as gl
+
+
+def _fill() -> gf.Component:
+    c = gf.Component()
+    c.add_polygon([(-60, -60), (60, -60), (0, 80)], layer=(1, 0))
+    gl.utils.dummy_fill(
+        component=c,
+        size=(400, 300),
+        centered=True,
+        fill_layer=(4, 0),
+        exclude_layers=[(1, 0)],
+        pitch=10,
+        density=0.25,
+        keep_out=8,
+    )
+    return c
+
+
+def test_tiles_keep_out() -> None:
+    c = _fill()
+    dbu = c.kcl.dbu
+    geometry = gf.kdb.Region(c.kdb_cell.begin_shapes_rec(gf.get_layer((1, 0))))
+    tiles = [
+        it.trans() * it.inst_trans()
+        for it in c.kdb_cell.begin_instances_rec()
+        if it.inst_cell().name.startswith("rectangle_gfelib")
+    ]
+
+    # every free site of the 40 x 30 grid gets exactly one tile, none within `keep_out` of the geometry
+    tile = gf.kdb.Box(-2500, -2500, 2500, 2500)
+    free = 0
+    for x in range(40):
+        for y in range(30):
+            site = gf.kdb.Vector(int((x * 10 - 195) / dbu), int((y * 10 - 145) / dbu))
+            grown = gf.kdb.Region(tile.moved(site)).sized(int(8 / dbu), int(8 / dbu), 2)
+            free += (grown & geometry).is_empty()
+    assert len(tiles) == len(set(str(t) for t in tiles)) == free
+    placed = gf.kdb.Region([tile.transformed(t) for t in tiles])
+    assert (placed.sized(int(8 / dbu) - 1, int(8 / dbu) - 1, 2) & geometry).is_empty()
+    assert c.kdb_cell.child_instances() < free
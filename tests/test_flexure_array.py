@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import gfelib as gl
+
+PARAMS = [
+    dict(
+        length=length,
+        width=4,
+        geometry_layer=(1, 0),
+        beam_spec=None,
+        release_spec=None,
+    )
+    for length in (100, 150)
+]
+
+
+def _placements(c: gf.Component) -> list[str]:
+    return sorted(
+        f"{it.inst_cell().name} {it.trans() * it.inst_trans()}"
+        for it in c.kdb_cell.begin_instances_rec()
+    )
+
+
+def test_matches_single_references() -> None:
+    origins = [(x * 12.5, y * 30.0005) for y in range(4) for x in range(6)]
+    origins += [(-40.0, 7.3), (-80.0, 7.3)]
+    params = [PARAMS[i % 2] for i in range(len(origins))]
+    rotations = [0.0 if i < 24 else 30.0 for i in range(len(origins))]
+    mirrors = [i % 3 == 0 for i in range(len(origins))]
+
+    c = gl.flexure.flexure_array(
+        func=gl.flexure.beam,
+        params=params,
+        origins=origins,
+        rotations=rotations,
+        mirrors=mirrors,
+    )
+
+    single = gf.Component()
+    for p, origin, rotation, mirror in zip(params, origins, rotations, mirrors):
+        ref = single << gl.flexure.beam(**p)
+        ref.dcplx_trans = gf.kdb.DCplxTrans(1, rotation, mirror, *origin)
+    assert _placements(c) == _placements(single)
+    assert c.kdb_cell.child_instances() < len(origins)
+
+
+def test_grid_is_one_array() -> None:
+    c = gl.flexure.flexure_array(
+        func=gl.flexure.beam,
+        params=PARAMS[:1],
+        origins=gl.utils.grid_lattice(
+            size=(500, 400), pitch=50, centered=True
+        ).tolist(),
+        rotations=None,
+        mirrors=None,
+    )
+    assert c.kdb_cell.child_instances() == 1
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import pytest
+
+import gfelib as gl
+
+
+@pytest.mark.parametrize(
+    "func, params",
+    [
+        (gl.basic.circle, dict(radius=120)),
+        (gl.basic.ring, dict(radius_inner=100, radius_outer=130, angles=(0, 360))),
+        (gl.basic.ring, dict(radius_inner=100, radius_outer=130, angles=(0, 250))),
+    ],
+)
+def test_sectors_match_single_polygon(func, params, xor_area) -> None:
+    kwargs = dict(
+        geometry_layer=(1, 0), angle_resolution=0.5, release_spec=None, **params
+    )
+    single = func(**kwargs)
+    fractured = func(max_points=200, **kwargs)
+    assert func(max_points=None, **kwargs) is single
+
+    assert xor_area(single, fractured, (1, 0)) == 0
+    region = gf.kdb.Region(fractured.kdb_cell.begin_shapes_rec(gf.get_layer((1, 0))))
+    assert region.count() > 1
+    assert max(p.num_points() for p in region.each()) <= 200
+
+
+def test_quadrants_share_sector_cells() -> None:
+    c = gl.basic.ring(
+        radius_inner=100,
+        radius_outer=130,
+        angles=(0, 360),
+        geometry_layer=(1, 0),
+        angle_resolution=0.5,
+        release_spec=None,
+        max_points=200,
+    )
+    sectors = [inst.cell.name for inst in c.kdb_cell.each_inst()]
+    assert len(set(sectors)) < len(sectors)
+
+
+def test_too_few_points_raise() -> None:
+    with pytest.raises(ValueError):
+        gl.utils.fracture_sectors(steps=720, step=0.5, max_points=3, wedge=False)
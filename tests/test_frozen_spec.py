@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import gfelib as gl
+
+
+def test_equal_specs_share_fingerprint_and_instance(release_spec_factory) -> None:
+    a, b = release_spec_factory(), release_spec_factory(hole_radius=2.0)
+    assert a is not b
+    assert a == b and hash(a) == hash(b)
+    assert a.fingerprint == b.fingerprint
+    assert a.interned() is b.interned()
+    assert release_spec_factory(distance=6) != a
+
+
+def test_model_copy_drops_cached_values(release_spec_factory) -> None:
+    a = release_spec_factory()
+    assert "distance=5.0" in str(a)
+    b = a.model_copy(update={"distance": 6})
+    assert b.fingerprint != a.fingerprint
+    assert "distance=6" in str(b)
+    assert b != a
+
+
+def test_equal_specs_hit_the_cell_cache(release_spec_factory) -> None:
+    params = dict(
+        radius=35,
+        geometry_layer=(1, 0),
+        angle_resolution=5,
+    )
+    c = gl.basic.circle(release_spec=release_spec_factory(), **params)
+    assert gl.basic.circle(release_spec=release_spec_factory(), **params) is c
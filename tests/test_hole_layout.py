@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import gfelib as gl
+
+
+def _placements(cell: gf.kdb.Cell, hole: gf.Component) -> list[str]:
+    # flattened transformation of every hole reference
+    return sorted(
+        str(it.trans() * it.inst_trans())
+        for it in cell.begin_instances_rec()
+        if it.inst_cell().name == hole.name
+    )
+
+
+def _ring_holes(release_spec: gl.datatypes.ReleaseSpec) -> gl.utils.HoleLayout:
+    return gl.utils.ring_holes(
+        radius_inner=40,
+        radius_outer=90,
+        span=120,
+        release_spec=release_spec,
+    )
+
+
+def test_place_matches_nested_references(release_spec) -> None:
+    holes = _ring_holes(release_spec)
+    inner = gf.Component()
+    holes.place(inner)
+
+    nested = gf.Component()
+    ref = nested << inner
+    ref.rotate(90, (0, 0))
+    ref.move((12.345, -6.789))
+
+    flat = gf.Component()
+    holes.rotated(90).moved(12.345, -6.789).place(flat)
+    assert _placements(flat.kdb_cell, release_spec.hole) == _placements(
+        nested.kdb_cell, release_spec.hole
+    )
+
+
+def test_merge_keeps_every_hole(release_spec) -> None:
+    holes = _ring_holes(release_spec)
+    merged = holes + holes.moved(200, 0)
+    assert len(merged) == 2 * len(holes)
+
+
+def test_stream_writer_writes_placed_holes(tmp_path, release_spec) -> None:
+    holes = _ring_holes(release_spec).moved(30, 40)
+    path = tmp_path / "holes.gds"
+    with gl.utils.StreamWriter(path, top_name="top") as w:
+        w.add_holes(holes)
+
+    placed = gf.Component()
+    holes.place(placed)
+
+    layout = gf.kdb.Layout()
+    layout.read(str(path))
+    assert _placements(layout.cell("top"), release_spec.hole) == _placements(
+        placed.kdb_cell, release_spec.hole
+    )
+
+
+def test_rectangle_ring_merges_part_holes(xor_area, release_spec) -> None:
+    c = gl.basic.rectangle_ring(
+        size=(210, 170),
+        width=25,
+        geometry_layer=(1, 0),
+        centered=True,
+        release_spec=release_spec,
+    )
+
+    # one released rectangle per part, as nested references
+    nested = gf.Component()
+    for size, origin in [
+        ((25, 25), (-105, -85)),
+        ((25, 25), (80, -85)),
+        ((25, 25), (-105, 60)),
+        ((25, 25), (80, 60)),
+        ((160, 25), (-80, -85)),
+        ((160, 25), (-80, 60)),
+        ((25, 120), (-105, -60)),
+        ((25, 120), (80, -60)),
+    ]:
+        ref = nested << gl.basic.rectangle(
+            size=size,
+            geometry_layer=(1, 0),
+            centered=False,
+            release_spec=release_spec,
+        )
+        ref.move(origin)
+    assert xor_area(c, nested, (2, 0)) == 0
+    assert _placements(c.kdb_cell, release_spec.hole) == _placements(
+        nested.kdb_cell, release_spec.hole
+    )
+
+    # every hole is referenced by the ring itself, the parts have none
+    direct = sum(
+        inst.cell_inst.size()
+        for inst in c.kdb_cell.each_inst()
+        if inst.cell.name == release_spec.hole.name
+    )
+    assert direct == len(_placements(c.kdb_cell, release_spec.hole)) > 0
+
+
+def test_parallel_merges_bar_and_beam_holes(release_spec) -> None:
+    beam_spec = gl.datatypes.BeamSpec(
+        release_thin=True,
+        release_thick=True,
+        thick_length=(0, 0.4),
+        thick_width=(20, 0),
+        thick_offset=(10.0005, 0),
+    )
+    params = dict(
+        bar_length=300,
+        bar_width=40,
+        beam_length=200,
+        beam_width=30,
+        beam_pos=[0, 0.5, 1],
+        geometry_layer=(1, 0),
+        beam_spec=beam_spec,
+    )
+    c = gl.flexure.parallel(release_spec=release_spec, **params)
+
+    # released bar and beam cells at the same places
+    nested = gf.Component()
+    ref = nested << gl.basic.rectangle(
+        size=(300, 40),
+        geometry_layer=(1, 0),
+        centered=True,
+        release_spec=release_spec,
+    )
+    ref.movey(20)
+    for inst in gl.flexure.parallel(release_spec=None, **params).insts:
+        if inst.cell.name.startswith("beam"):
+            ref = nested << gl.flexure.beam(
+                length=200,
+                width=30,
+                geometry_layer=(1, 0),
+                beam_spec=beam_spec,
+                release_spec=release_spec,
+            )
+            ref.dcplx_trans = inst.dcplx_trans
+    assert _placements(c.kdb_cell, release_spec.hole) == _placements(
+        nested.kdb_cell, release_spec.hole
+    )
+    assert all(
+        inst.cell.name != release_spec.hole.name
+        for part in c.kdb_cell.each_inst()
+        for inst in part.cell.each_inst()
+    )
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import json
+import pathlib
+import subprocess
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+
+def _loaded(statement: str) -> list[str]:
+    script = (
+        "import json, sys\n"
+        "import gfelib as gl\n"
+        f"{statement}\n"
+        "print(json.dumps(sorted(m for m in ('gdsfactory', 'kfactory', 'klayout', 'numpy') if m in sys.modules)))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    return json.loads(proc.stdout)
+
+
+def test_import_is_lazy() -> None:
+    assert _loaded("") == []
+
+
+def test_datatypes_do_not_load_gdsfactory() -> None:
+    assert _loaded("gl.datatypes.ReleaseSpec; gl.datatypes.BeamSpec") == []
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import gfelib as gl
+
+PARAMS = [
+    dict(
+        size=(size, 23),
+        geometry_layer=(1, 0),
+        centered=False,
+        release_spec=None,
+    )
+    for size in (41, 42, 41, 43)
+]
+
+
+def _activate() -> None:
+    gf.gpdk.PDK.activate()
+
+
+def test_cells_built_in_workers() -> None:
+    with gl.utils.parallel_build(max_workers=2, initializer=_activate):
+        with gl.utils.build_stats() as stats:
+            cells = gl.utils.build_cells(func=gl.basic.rectangle, params=PARAMS)
+
+    # every cell was loaded from a worker before the call, so the cache answers all of them
+    assert (stats.cells["rectangle"].calls, stats.cells["rectangle"].misses) == (4, 0)
+    assert cells[0] is cells[2]
+    assert [c.dbbox().width() for c in cells] == [41, 42, 41, 43]
+    assert gl.utils.get_build_stats() is None
+
+
+def test_serial_without_pool() -> None:
+    with gl.utils.build_stats() as stats:
+        cells = gl.utils.build_cells(
+            func=gl.basic.rectangle,
+            params=[dict(p, size=(p["size"][0], 29)) for p in PARAMS],
+        )
+    assert (stats.cells["rectangle"].calls, stats.cells["rectangle"].misses) == (4, 3)
+    assert [c.dbbox().height() for c in cells] == [29] * 4
+
+
+def test_sweep_inside_parallel_build() -> None:
+    # sweep workers are forked from a process with a pool, their `build_cells` must not submit to it
+    with gl.utils.parallel_build(max_workers=2, initializer=_activate):
+        c = gl.utils.sweep(
+            func=gl.basic.rectangle_ring,
+            params=dict(
+                size=[(310, 190), (330, 190)],
+                width=[30],
+                geometry_layer=[(1, 0)],
+                centered=[True],
+                release_spec=[None],
+            ),
+            spacing=20,
+            columns=None,
+            label_layer=None,
+            max_workers=2,
+            initializer=_activate,
+        )
+    assert [inst.cell.dbbox().width() for inst in c.kdb_cell.each_inst()] == [310, 330]
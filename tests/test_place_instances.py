@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import numpy as np
+import pytest
+
+import gfelib as gl
+
+
+def _single_references(
+    hole: gf.Component, points: np.ndarray, angle: float
+) -> gf.Component:
+    # one reference per hole, as holes were placed before array references
+    c = gf.Component()
+    for x, y in gl.utils.rotated_lattice(points=points, angle=angle, dbu=c.kcl.dbu):
+        c.kdb_cell.insert(
+            gf.kdb.DCellInstArray(
+                hole.cell_index(),
+                gf.kdb.DCplxTrans(1, angle, False, x, y),
+            )
+        )
+    return c
+
+
+def _placements(c: gf.Component) -> list[str]:
+    return sorted(
+        str(it.trans() * it.inst_trans()) for it in c.kdb_cell.begin_instances_rec()
+    )
+
+
+# hole lattices as functions of the release pitch
+@pytest.mark.parametrize(
+    "lattice, angle",
+    [
+        (
+            lambda pitch: gl.utils.grid_lattice(
+                size=(400, 300), pitch=pitch, centered=True
+            ),
+            0,
+        ),
+        (
+            lambda pitch: gl.utils.grid_lattice(
+                size=(400, 297.3), pitch=pitch, centered=False
+            ),
+            90,
+        ),
+        (
+            lambda pitch: gl.utils.grid_lattice(
+                size=(400, 300), pitch=10, centered=True
+            ),
+            0,
+        ),
+        (
+            lambda pitch: gl.utils.grid_lattice(
+                size=(500, 300), pitch=pitch, centered=True
+            ),
+            30,
+        ),
+        (lambda pitch: gl.utils.circle_lattice(radius=150, pitch=pitch), 0),
+        (
+            lambda pitch: gl.utils.ring_lattice(
+                radius_inner=100, radius_outer=180, span=75, pitch=pitch
+            ),
+            33.3,
+        ),
+    ],
+)
+def test_place_holes_match_single_references(lattice, angle, release_spec) -> None:
+    points = lattice(gl.utils.release_pitch(release_spec))
+    c = gf.Component()
+    gl.utils.place_holes(
+        component=c, hole=release_spec.hole, points=points, angle=angle
+    )
+    assert _placements(c) == _placements(
+        _single_references(hole=release_spec.hole, points=points, angle=angle)
+    )
+
+
+def test_regular_lattice_is_one_array(release_spec) -> None:
+    c = gf.Component()
+    gl.utils.place_holes(
+        component=c,
+        hole=release_spec.hole,
+        points=gl.utils.grid_lattice(size=(400, 300), pitch=10, centered=True),
+    )
+    assert c.kdb_cell.child_instances() == 1
+
+
+def test_snap_dbu_rounds_half_away_from_zero() -> None:
+    values = np.array([0.25, -0.25, 0.75, 0.2])
+    assert gl.utils.snap_dbu(values, 0.5).tolist() == [1, -1, 2, 0]
+
+
+def test_rows_with_gaps_become_one_array_per_segment(release_spec) -> None:
+    c = gf.Component()
+    xs = [0, 10, 20, 50, 60, 70, 80]
+    gl.utils.place_instances(
+        component=c,
+        cell=release_spec.hole,
+        points=np.array([(x, y) for y in (0, 10, 20) for x in xs], dtype=float),
+    )
+    assert c.kdb_cell.child_instances() == 2
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import gfelib as gl
+
+
+def _params(beam_length: float) -> dict:
+    return dict(
+        bar_length=170,
+        bar_width=30,
+        beam_length=beam_length,
+        beam_width=7,
+        beam_pos=[0, 0.5, 1],
+        geometry_layer=(1, 0),
+        beam_spec=None,
+        release_spec=None,
+    )
+
+
+def test_graph_links_parents_and_children() -> None:
+    with gl.utils.cell_graph() as graph:
+        c = gl.flexure.parallel(**_params(beam_length=230))
+
+    assert graph.roots == [c.name]
+    beams = [n for n, node in graph.nodes.items() if node.function.endswith(".beam")]
+    assert len(beams) == 1
+    assert graph.parents(beams[0]) == [c.name]
+    assert graph.ancestors(beams) == {beams[0], c.name}
+
+
+def test_rebuild_runs_only_changed_cells(tmp_path) -> None:
+    path = tmp_path / "parallel.gds"
+    _, first = gl.utils.rebuild(
+        func=gl.flexure.parallel, params=_params(beam_length=240), path=path
+    )
+    assert gl.utils.CellGraph.read_json(path.with_suffix(".json")).nodes == first.nodes
+
+    # a longer beam rebuilds the beam and its parents, the bar is reused
+    c, graph = gl.utils.rebuild(
+        func=gl.flexure.parallel, params=_params(beam_length=250), path=path
+    )
+    beam = next(n for n in graph.built_cells() if ".beam" in graph.nodes[n].function)
+    assert set(graph.built_cells()) == graph.ancestors([beam]) | set(
+        graph.nodes[beam].children
+    )
+    assert len(graph.reused_cells()) == 1
+    changes = graph.changes(first)
+    assert changes[beam] == ["length"]
+    assert changes[c.name] == ["beam_length"]
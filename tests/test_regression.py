@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import gfelib as gl
+
+
+def _calls(width: float, release_spec: gl.datatypes.ReleaseSpec) -> list:
+    return [
+        (
+            gl.basic.rectangle,
+            dict(
+                size=(width, 120),
+                geometry_layer=(1, 0),
+                centered=True,
+                release_spec=release_spec,
+            ),
+        ),
+        (
+            gl.basic.circle,
+            dict(
+                radius=60,
+                geometry_layer=(1, 0),
+                angle_resolution=2,
+                release_spec=None,
+            ),
+        ),
+    ]
+
+
+def test_unchanged_layout_has_no_diffs(tmp_path, release_spec) -> None:
+    path = tmp_path / "golden.gds"
+    calls = _calls(width=230, release_spec=release_spec)
+    gl.utils.write_golden(calls=calls, path=path)
+    assert gl.utils.compare_golden(calls=calls, path=path) == []
+
+
+def test_changed_layout_reports_layers_and_regions(tmp_path, release_spec) -> None:
+    path = tmp_path / "golden.gds"
+    gl.utils.write_golden(calls=_calls(width=230, release_spec=release_spec), path=path)
+
+    # a wider rectangle, renamed, is still matched to its golden cell by position
+    calls = _calls(width=240, release_spec=release_spec)
+    diffs = gl.utils.compare_golden(
+        calls=calls,
+        path=path,
+        tile_size=50,
+        max_workers=1,
+    )
+    changed = gl.basic.rectangle(**calls[0][1]).name
+    assert {(d.cell, d.layer) for d in diffs} == {(changed, (1, 0)), (changed, (2, 0))}
+
+    geometry = next(d for d in diffs if d.layer == (1, 0))
+    assert abs(geometry.area - 10 * 120) < 1e-6
+    assert all(
+        x0 >= 115 - 1e-6 or x1 <= -115 + 1e-6 for x0, _, x1, _ in geometry.regions
+    )
+
+
+def test_parallel_matches_serial(tmp_path, release_spec) -> None:
+    path = tmp_path / "golden.gds"
+    gl.utils.write_golden(calls=_calls(width=230, release_spec=release_spec), path=path)
+    kwargs = dict(
+        calls=_calls(width=250, release_spec=release_spec), path=path, tile_size=40
+    )
+    serial = gl.utils.compare_golden(max_workers=1, **kwargs)
+    parallel = gl.utils.compare_golden(max_workers=2, **kwargs)
+    assert [(d.cell, d.layer, round(d.area, 6)) for d in serial] == [
+        (d.cell, d.layer, round(d.area, 6)) for d in parallel
+    ]
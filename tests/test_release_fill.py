@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import numpy as np
+
+import gfelib as gl
+
+
+def test_release_fill_leaves_no_islands(release_spec) -> None:
+    c = gf.Component()
+    c.add_polygon(
+        [(0, 0), (200, 0), (200, 60), (70, 60), (70, 150), (0, 150)],
+        layer=(1, 0),
+    )
+    assert gl.utils.unreleased_islands(
+        component=c, geometry_layer=(1, 0), release_spec=release_spec
+    )
+
+    gl.utils.release_fill(component=c, geometry_layer=(1, 0), release_spec=release_spec)
+    assert not gl.utils.unreleased_islands(
+        component=c, geometry_layer=(1, 0), release_spec=release_spec
+    )
+
+
+def test_boundary_lattice_spacing() -> None:
+    region = gf.kdb.Region(gf.kdb.Box(0, 0, 1000, 300))
+    points = gl.utils.boundary_lattice(region=region, pitch=70, dbu=1)
+
+    # every vertex is a sample and consecutive samples along the outline are at most a pitch apart
+    for corner in ((0, 0), (1000, 0), (1000, 300), (0, 300)):
+        assert np.any(np.all(points == corner, axis=1))
+    outline = np.concatenate((points, points[:1]))
+    assert np.max(np.hypot(*np.diff(outline, axis=0).T)) <= 70
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import numpy as np
+
+import gfelib as gl
+
+
+def _rectangle(release_spec: gl.datatypes.ReleaseSpec) -> gf.Component:
+    return gl.basic.rectangle(
+        size=(403.7, 211.3),
+        geometry_layer=(1, 0),
+        centered=True,
+        release_spec=release_spec,
+    )
+
+
+def test_hole_tiles_match_holes(xor_area, release_spec_factory, release_spec) -> None:
+    c = _rectangle(release_spec_factory(hole_tiling=True))
+    assert xor_area(_rectangle(release_spec), c, (2, 0)) == 0
+
+
+def test_hole_tiles_are_shared_cells(release_spec_factory, release_spec) -> None:
+    c = _rectangle(release_spec_factory(hole_tiling=True))
+    tiles = [
+        c.kcl[i]
+        for i in c.kdb_cell.called_cells()
+        if c.kcl[i].name.startswith("hole_tile")
+    ]
+    holes = len(
+        gl.utils.grid_lattice(
+            size=(403.7, 211.3),
+            pitch=gl.utils.release_pitch(release_spec),
+            centered=True,
+        )
+    )
+    assert 0 < len(tiles) < holes.bit_length() * 4
+    assert all(tile.locked for tile in tiles)
+
+
+def test_hole_array_matches_holes(xor_area, release_spec_factory, release_spec) -> None:
+    c = _rectangle(release_spec_factory(hole_array=True))
+    assert xor_area(_rectangle(release_spec), c, (2, 0)) == 0
+
+    # the rectangle and a few interleaved hole arrays, the pitch is off the database grid
+    holes = len(
+        gl.utils.grid_lattice(
+            size=(403.7, 211.3),
+            pitch=gl.utils.release_pitch(release_spec),
+            centered=True,
+        )
+    )
+    assert c.kdb_cell.child_instances() < np.sqrt(holes)
+    assert (
+        sum(
+            1
+            for it in c.kdb_cell.begin_instances_rec()
+            if it.inst_cell().name == release_spec.hole.name
+        )
+        == holes
+    )
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import gfelib as gl
+
+
+def test_hole_array_default_not_in_name(release_spec_factory) -> None:
+    assert "hole_array" not in str(release_spec_factory())
+    assert "hole_array=True" in str(release_spec_factory(hole_array=True))
+
+
+def test_max_error_default_not_in_name(release_spec_factory) -> None:
+    assert "max_error" not in str(release_spec_factory())
+    assert "max_error=0.01" in str(release_spec_factory(max_error=0.01))
+
+
+def test_hole_tiling_default_not_in_name(release_spec_factory) -> None:
+    assert "hole_tiling" not in str(release_spec_factory())
+    assert "hole_tiling=True" in str(release_spec_factory(hole_tiling=True))
+
+
+def test_default_name_unchanged(release_spec_factory) -> None:
+    # string form of the spec before any optional field was added
+    assert str(release_spec_factory()) == (
+        "hole_radius=2.0 distance=5.0 angle_resolution=10.0 layer=(2, 0)"
+    )
+
+
+def test_hole_cell_shared_by_equal_specs(release_spec_factory) -> None:
+    hole = release_spec_factory().hole
+    assert release_spec_factory().hole is hole
+    assert release_spec_factory().hole_polygon == release_spec_factory().hole_polygon
+    assert release_spec_factory(max_error=0.01).hole is not hole
+
+    gl.datatypes.ReleaseSpec.clear_hole_cache()
+    assert gl.datatypes.release_spec._HOLE_CACHE == {}
+    assert release_spec_factory().hole.name == hole.name
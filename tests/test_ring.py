@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import numpy as np
+
+import gfelib as gl
+
+
+def _ring(
+    angles: tuple[float, float], release_spec: gl.datatypes.ReleaseSpec
+) -> gf.Component:
+    return gl.basic.ring(
+        radius_inner=100,
+        radius_outer=160,
+        angles=angles,
+        geometry_layer=(1, 0),
+        angle_resolution=0.5,
+        release_spec=release_spec,
+    )
+
+
+def test_rotated_rings_share_one_cell(release_spec) -> None:
+    cells = [
+        {inst.cell.name for inst in _ring(angles, release_spec).kdb_cell.each_inst()}
+        for angles in ((37.3, 151.9), (-80, 34.6), (200, 314.6))
+    ]
+    assert len(cells[0]) == 1
+    assert cells[0] == cells[1] == cells[2]
+
+
+def test_rotated_holes_within_one_dbu(release_spec) -> None:
+    start, end = 37.3, 151.9
+    c = _ring((start, end), release_spec)
+    holes = np.array(
+        [
+            (
+                (it.dtrans() * it.inst_dtrans()).disp.x,
+                (it.dtrans() * it.inst_dtrans()).disp.y,
+            )
+            for it in c.kdb_cell.begin_instances_rec()
+            if it.inst_cell().name == release_spec.hole.name
+        ]
+    )
+
+    # holes are snapped before the start rotation, so they land within one database unit of the exact lattice along x and y
+    t = np.radians(start)
+    exact = gl.utils.ring_lattice(
+        radius_inner=100,
+        radius_outer=160,
+        span=end - start,
+        pitch=gl.utils.release_pitch(release_spec),
+    ) @ np.array([[np.cos(t), np.sin(t)], [-np.sin(t), np.cos(t)]])
+    assert len(holes) == len(exact)
+    error = np.abs(holes[:, None] - exact[None]).max(axis=-1).min(axis=1)
+    assert error.max() <= c.kcl.dbu
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import numpy as np
+import pytest
+
+import gfelib as gl
+
+PARAMS = dict(
+    radius_inner=300,
+    radius_gap=400,
+    radius_outer=500,
+    teeth_pitch=1,
+    teeth_width=4,
+    teeth_height=20,
+    teeth_clearance=3,
+    teeth_phase=[0, 120, 240],
+    teeth_count=5,
+    inner_rotor=True,
+    rotor_span=40,
+    geometry_layer=(1, 0),
+    angle_resolution=1,
+    release_spec=None,
+)
+
+
+def test_sectors_are_references_to_one_half(xor_area) -> None:
+    c = gl.actuator.rotator(symmetry=3, mirror=True, **PARAMS)
+    assert {inst.cell.name for inst in c.kdb_cell.each_inst()} == {
+        gl.actuator.rotator_gear(**PARAMS).name
+    }
+
+    expected = gf.Component()
+    for k in range(3):
+        ref = expected << gl.actuator.rotator_gear(**PARAMS)
+        ref.dcplx_trans = gf.kdb.DCplxTrans(1, 120 * k, k % 2 == 1, 0, 0)
+    assert xor_area(c, expected, (1, 0)) == 0
+
+
+def test_stator_ports_of_every_sector() -> None:
+    half = gl.actuator.rotator_gear(**PARAMS)
+    c = gl.actuator.rotator(symmetry=4, mirror=False, **PARAMS)
+    assert len(c.ports) == 4 * len(PARAMS["teeth_phase"])
+
+    # sector `k` ports are the half-rotator ports rotated by `90 * k`
+    for k in range(4):
+        t = np.radians(90 * k)
+        for i in range(len(PARAMS["teeth_phase"])):
+            x, y = half.ports[f"stator_{i}"].center
+            port = c.ports[f"stator_{k}_{i}"]
+            expected = (x * np.cos(t) - y * np.sin(t), x * np.sin(t) + y * np.cos(t))
+            assert np.allclose(port.center, expected, atol=c.kcl.dbu)
+
+
+def test_overlapping_sectors_raise() -> None:
+    with pytest.raises(ValueError):
+        gl.actuator.rotator(symmetry=10, mirror=False, **PARAMS)
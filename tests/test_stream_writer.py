@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import pytest
+
+import gfelib as gl
+
+PLACEMENTS = [((0, 0), 0, False), ((500, 0), 90, False), ((0, 400), 30, True)]
+
+
+def _device(release_spec: gl.datatypes.ReleaseSpec) -> gf.Component:
+    return gl.basic.rectangle_ring(
+        size=(210, 170),
+        width=25,
+        geometry_layer=(1, 0),
+        centered=True,
+        release_spec=release_spec,
+    )
+
+
+def _region(cell: gf.kdb.Cell, layer: tuple[int, int]) -> gf.kdb.Region:
+    li = cell.layout().find_layer(*layer)
+    # merged into a flat copy, regions from a shape iterator read the layout lazily
+    return gf.kdb.Region(cell.begin_shapes_rec(li)).merged()
+
+
+def test_written_layout_matches_placements(tmp_path, release_spec) -> None:
+    # expected geometry, taken before the writer releases the device from the layout
+    expected = gf.Component()
+    for origin, rotation, mirror in PLACEMENTS:
+        ref = expected << _device(release_spec)
+        ref.dcplx_trans = gf.kdb.DCplxTrans(1, rotation, mirror, *origin)
+    regions = {layer: _region(expected.kdb_cell, layer) for layer in ((1, 0), (2, 0))}
+
+    path = tmp_path / "top.gds"
+    with gl.utils.StreamWriter(path, top_name="top") as w:
+        (origin, rotation, mirror), *others = PLACEMENTS
+        name = w.add(
+            _device(release_spec), origin=origin, rotation=rotation, mirror=mirror
+        )
+        for origin, rotation, mirror in others:
+            w.place(name, origin=origin, rotation=rotation, mirror=mirror)
+    assert not path.with_name("top.gds.partial").exists()
+
+    layout = gf.kdb.Layout()
+    layout.read(str(path))
+    for layer, region in regions.items():
+        assert (_region(layout.cell("top"), layer) ^ region).is_empty()
+
+
+def test_failed_write_leaves_no_file(tmp_path) -> None:
+    path = tmp_path / "top.gds"
+    with pytest.raises(KeyError):
+        with gl.utils.StreamWriter(path, top_name="top") as w:
+            w.place("missing")
+    assert not list(tmp_path.iterdir())
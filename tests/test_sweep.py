@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import gfelib as gl
+
+AXES = {
+    "size": [(50, 31), (80, 31), (50, 61)],
+    "geometry_layer": [(1, 0)],
+    "centered": [True],
+    "release_spec": [None],
+}
+
+
+def _activate() -> None:
+    gf.gpdk.PDK.activate()
+
+
+def test_sweep_grid_is_cartesian_product() -> None:
+    grid = gl.utils.sweep_grid({"a": [1, 2], "b": ["x", "y", "z"]})
+    assert len(grid) == 6
+    assert grid[0] == {"a": 1, "b": "x"}
+    assert grid[-1] == {"a": 2, "b": "z"}
+
+
+def test_parallel_sweep_loads_worker_cells() -> None:
+    # variants unique to this test, so none is cached in this process before the workers build them
+    c = gl.utils.sweep(
+        func=gl.basic.rectangle,
+        params=AXES,
+        spacing=20,
+        columns=None,
+        label_layer=(10, 0),
+        max_workers=2,
+        initializer=_activate,
+    )
+
+    variants = [inst.cell for inst in c.kdb_cell.each_inst()]
+    assert [v.dbbox().width() for v in variants] == [50, 80, 50]
+    assert [v.dbbox().height() for v in variants] == [31, 31, 61]
+    assert len({v.name for v in variants}) == 3
+    region = gf.kdb.Region(c.kdb_cell.begin_shapes_rec(gf.get_layer((1, 0))))
+    assert region.area() == round((50 * 31 + 80 * 31 + 50 * 61) / c.kcl.dbu**2)
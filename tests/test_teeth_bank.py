@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import numpy as np
+
+import gfelib as gl
+
+
+def _bank(teeth_count: int) -> gf.Component:
+    return gl.actuator.teeth_bank(
+        radius=500,
+        teeth_size=(20, 4),
+        teeth_pitch=1.7,
+        teeth_count=teeth_count,
+        geometry_layer=(1, 0),
+    )
+
+
+def test_references_scale_with_log_count() -> None:
+    bank = _bank(100)
+    cells = [bank.kdb_cell] + [
+        bank.kcl[i].kdb_cell for i in bank.kdb_cell.called_cells()
+    ]
+    assert len(cells) <= 2 * int(np.log2(100)) + 2
+    assert all(cell.child_instances() <= 2 for cell in cells)
+
+
+def test_teeth_are_exact_rotations() -> None:
+    # bank rotated in a parent, each tooth vertex only carries its own rounding
+    c = gf.Component()
+    bank_ref = c << _bank(37)
+    bank_ref.rotate(23.1, (0, 0))
+
+    dbu = c.kcl.dbu
+    corners = np.array([(490, -2), (510, -2), (510, 2), (490, 2)]) / dbu
+    t = (23.1 + 1.7 * np.arange(37)[:, None]) * np.pi / 180
+    ideal = np.stack(
+        (
+            corners[:, 0] * np.cos(t) - corners[:, 1] * np.sin(t),
+            corners[:, 0] * np.sin(t) + corners[:, 1] * np.cos(t),
+        ),
+        axis=-1,
+    ).reshape(-1, 2)
+
+    vertices = np.array(
+        [
+            (p.x, p.y)
+            for it in c.kdb_cell.begin_shapes_rec(gf.get_layer((1, 0)))
+            for p in it.shape().polygon.transformed(it.trans()).each_point_hull()
+        ]
+    )
+    assert len(vertices) == len(ideal)
+    distance = np.hypot(*(vertices[:, None] - ideal[None]).transpose(2, 0, 1))
+    assert np.max(np.min(distance, axis=1)) <= 0.5 * np.sqrt(2) + 1e-9
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import gfelib as gl
+
+
+def test_released_rectangle_has_no_islands(release_spec) -> None:
+    c = gl.basic.rectangle(
+        size=(300, 120),
+        geometry_layer=(1, 0),
+        centered=False,
+        release_spec=release_spec,
+    )
+    assert not gl.utils.unreleased_islands(
+        component=c, geometry_layer=(1, 0), release_spec=release_spec
+    )
+
+
+def test_missing_hole_leaves_island(release_spec) -> None:
+    c = gf.Component()
+    _ = c << gf.components.rectangle(size=(300, 120), layer=(1, 0))
+    points = gl.utils.grid_lattice(
+        size=(300, 120), pitch=gl.utils.release_pitch(release_spec), centered=False
+    )
+    # drop the hole nearest to the center
+    missing = ((points - (150, 60)) ** 2).sum(axis=1).argmin()
+    gl.utils.place_holes(
+        component=c,
+        hole=release_spec.hole,
+        points=points[[i for i in range(len(points)) if i != missing]],
+    )
+
+    islands = gl.utils.unreleased_islands(
+        component=c, geometry_layer=(1, 0), release_spec=release_spec
+    )
+    assert len(islands) == 1
+    assert islands[0].bbox().contains(gf.kdb.DPoint(*points[missing]))
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+import gfelib as gl
+
+
+def _box(x0: float, y0: float, x1: float, y1: float) -> gf.kdb.Region:
+    return gf.kdb.Region(gf.kdb.DBox(x0, y0, x1, y1).to_itype(gf.kcl.dbu))
+
+
+def test_overlapping_beams_apply_in_order() -> None:
+    # the second isolation moat cuts into the first island, the third inset cuts into the second island
+    beams = [
+        gl.flexure.ZCantileverBeam(
+            length=50,
+            width=10,
+            position=(position, 0),
+            inset_x=(inset_x, 0),
+            inset_y=(10, 0),
+            isolation_x=(30, 0),
+            isolation_y=(40, 0),
+            spec=None,
+        )
+        for position, inset_x in ((40, 20), (65, 20), (95, 60))
+    ]
+    c = gl.flexure.z_cantilever_half(
+        length=200,
+        width=200,
+        beams=beams,
+        clearance=5,
+        middle_split=True,
+        geometry_layer=(1, 0),
+        handle_layer=(3, 0),
+        release_spec=None,
+    )
+
+    # moat, island and inset of one beam after the other, like chained booleans
+    expected = _box(0, 2.5, 200, 100)
+    for position, inset_x in ((40, 20), (65, 20), (95, 60)):
+        island = _box(position - 15, 60, position + 15, 100)
+        expected -= island.sized(gf.kcl.to_dbu(5), gf.kcl.to_dbu(5), 2)
+        expected += island
+        expected -= _box(position - 0.5 * inset_x, 90, position + 0.5 * inset_x, 100)
+
+    body = gf.kdb.Region(c.kdb_cell.shapes(gf.get_layer((1, 0))))
+    assert (body ^ expected).is_empty()